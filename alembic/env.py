@@ -11,6 +11,9 @@ from app.models.base import Base
 from app.models.summary import Summary
 from app.models.event import Event
 from app.models.tweet import Tweet
+from app.models.list_sync_state import ListSyncState
+from app.models.llm_cache import LLMCacheEntry
+from app.models.tweet_day_stats import TweetDayStats
 
 
 import sys
@@ -0,0 +1,50 @@
+"""add_tweet_query_indexes
+
+Revision ID: 2ae42c5a5d0a
+Revises: 44d725eeeb1d
+Create Date: 2026-10-18 10:04:27.551902
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '2ae42c5a5d0a'
+down_revision: Union[str, None] = '44d725eeeb1d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Build concurrently so ingestion keeps writing while the indexes are created
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tweets_list_id_tweet_id',
+            'tweets',
+            ['list_id', 'tweet_id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            op.f('ix_tweets_created_at'),
+            'tweets',
+            ['created_at'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            op.f('ix_tweets_created_at'),
+            table_name='tweets',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_tweets_list_id_tweet_id',
+            table_name='tweets',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,35 @@
+"""add_pagination_indexes
+
+Revision ID: 40b3c9ef7ade
+Revises: e08bd404ee83
+Create Date: 2026-10-18 19:12:40.208735
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '40b3c9ef7ade'
+down_revision: Union[str, None] = 'e08bd404ee83'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Partitioned tables can't be indexed concurrently; this cascades to each partition
+    op.create_index('ix_tweets_created_at_id', 'tweets', ['created_at', 'id'], unique=False)
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_summaries_date_summarized_id',
+            'summaries',
+            ['date_summarized', 'id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_summaries_date_summarized_id', table_name='summaries')
+    op.drop_index('ix_tweets_created_at_id', table_name='tweets')
@@ -0,0 +1,71 @@
+"""tweet_ids_to_bigint
+
+Revision ID: 410ca8f956bd
+Revises: 2ae42c5a5d0a
+Create Date: 2026-10-18 11:26:03.842117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '410ca8f956bd'
+down_revision: Union[str, None] = '2ae42c5a5d0a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _to_bigint(column: str) -> str:
+    # Legacy rows may hold '' or 'None' from str(None)
+    return f"CASE WHEN {column} ~ '^[0-9]+$' THEN {column}::bigint END"
+
+
+def upgrade() -> None:
+    op.alter_column(
+        'tweets', 'tweet_id',
+        type_=sa.BigInteger(), existing_type=sa.String(), existing_nullable=False,
+        postgresql_using='tweet_id::bigint',
+    )
+    op.alter_column(
+        'tweets', 'author_id',
+        type_=sa.BigInteger(), existing_type=sa.String(),
+        postgresql_using=_to_bigint('author_id'),
+    )
+    op.alter_column(
+        'tweets', 'list_id',
+        type_=sa.BigInteger(), existing_type=sa.String(),
+        postgresql_using=_to_bigint('list_id'),
+    )
+    op.alter_column(
+        'list_sync_state', 'list_id',
+        type_=sa.BigInteger(), existing_type=sa.String(), existing_nullable=False,
+        postgresql_using='list_id::bigint',
+    )
+    op.alter_column(
+        'list_sync_state', 'high_water_id',
+        type_=sa.BigInteger(), existing_type=sa.String(),
+        postgresql_using=_to_bigint('high_water_id'),
+    )
+    op.alter_column(
+        'list_sync_state', 'pending_high_water_id',
+        type_=sa.BigInteger(), existing_type=sa.String(),
+        postgresql_using=_to_bigint('pending_high_water_id'),
+    )
+
+
+def downgrade() -> None:
+    for table, column in [
+        ('list_sync_state', 'pending_high_water_id'),
+        ('list_sync_state', 'high_water_id'),
+        ('list_sync_state', 'list_id'),
+        ('tweets', 'list_id'),
+        ('tweets', 'author_id'),
+        ('tweets', 'tweet_id'),
+    ]:
+        op.alter_column(
+            table, column,
+            type_=sa.String(), existing_type=sa.BigInteger(),
+            postgresql_using=f'{column}::text',
+        )
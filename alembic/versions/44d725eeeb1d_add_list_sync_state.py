@@ -0,0 +1,33 @@
+"""add_list_sync_state
+
+Revision ID: 44d725eeeb1d
+Revises: 7a069ddcb867
+Create Date: 2026-10-18 09:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '44d725eeeb1d'
+down_revision: Union[str, None] = '7a069ddcb867'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'list_sync_state',
+        sa.Column('list_id', sa.String(), nullable=False),
+        sa.Column('high_water_id', sa.String(), nullable=True),
+        sa.Column('pending_high_water_id', sa.String(), nullable=True),
+        sa.Column('next_token', sa.String(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('list_id'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('list_sync_state')
@@ -0,0 +1,110 @@
+"""partition_tweets_by_month
+
+Revision ID: 4d5c2a78bd5d
+Revises: 410ca8f956bd
+Create Date: 2026-10-18 13:47:52.106384
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '4d5c2a78bd5d'
+down_revision: Union[str, None] = '410ca8f956bd'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = "id, tweet_id, text, created_at, author_id, list_id, author_username, author_name"
+
+# Monthly partitions from the oldest tweet up to 3 months ahead,
+# app.maintenance keeps creating them from there
+CREATE_PARTITIONS_SQL = """
+DO $$
+DECLARE
+    month date;
+    last_month date;
+BEGIN
+    SELECT date_trunc('month', coalesce(min(created_at), now()))::date
+    INTO month FROM tweets_unpartitioned;
+    last_month := (date_trunc('month', now()) + interval '3 months')::date;
+
+    WHILE month <= last_month LOOP
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF tweets FOR VALUES FROM (%L) TO (%L)',
+            'tweets_' || to_char(month, 'YYYY_MM'),
+            month,
+            (month + interval '1 month')::date
+        );
+        month := (month + interval '1 month')::date;
+    END LOOP;
+END $$;
+"""
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE tweets RENAME TO tweets_unpartitioned")
+    op.execute("ALTER TABLE tweets_unpartitioned RENAME CONSTRAINT tweets_pkey TO tweets_unpartitioned_pkey")
+    op.execute("ALTER INDEX ix_tweets_tweet_id RENAME TO ix_tweets_unpartitioned_tweet_id")
+    op.execute("ALTER INDEX ix_tweets_list_id_tweet_id RENAME TO ix_tweets_unpartitioned_list_id_tweet_id")
+    op.execute("ALTER INDEX ix_tweets_created_at RENAME TO ix_tweets_unpartitioned_created_at")
+    # Keep the id sequence when the old table is dropped
+    op.execute("ALTER SEQUENCE tweets_id_seq OWNED BY NONE")
+
+    op.execute(
+        """
+        CREATE TABLE tweets (
+            id integer NOT NULL DEFAULT nextval('tweets_id_seq'),
+            tweet_id bigint NOT NULL,
+            text varchar,
+            created_at timestamp NOT NULL,
+            author_id bigint,
+            list_id bigint,
+            author_username varchar,
+            author_name varchar,
+            CONSTRAINT tweets_pkey PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+        """
+    )
+    op.execute("ALTER SEQUENCE tweets_id_seq OWNED BY tweets.id")
+    op.create_index('ix_tweets_tweet_id', 'tweets', ['tweet_id', 'created_at'], unique=True)
+    op.create_index('ix_tweets_list_id_tweet_id', 'tweets', ['list_id', 'tweet_id'])
+    op.create_index('ix_tweets_created_at', 'tweets', ['created_at'])
+    op.execute(CREATE_PARTITIONS_SQL)
+
+    # Rows without created_at cannot be routed to a partition
+    op.execute(
+        f"INSERT INTO tweets ({COLUMNS}) SELECT {COLUMNS} FROM tweets_unpartitioned "
+        "WHERE created_at IS NOT NULL"
+    )
+    op.drop_table('tweets_unpartitioned')
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE tweets RENAME TO tweets_partitioned")
+    op.execute("ALTER TABLE tweets_partitioned RENAME CONSTRAINT tweets_pkey TO tweets_partitioned_pkey")
+    op.execute("ALTER INDEX ix_tweets_tweet_id RENAME TO ix_tweets_partitioned_tweet_id")
+    op.execute("ALTER INDEX ix_tweets_list_id_tweet_id RENAME TO ix_tweets_partitioned_list_id_tweet_id")
+    op.execute("ALTER INDEX ix_tweets_created_at RENAME TO ix_tweets_partitioned_created_at")
+    op.execute("ALTER SEQUENCE tweets_id_seq OWNED BY NONE")
+
+    op.create_table(
+        'tweets',
+        sa.Column('id', sa.Integer(), server_default=sa.text("nextval('tweets_id_seq')"), nullable=False),
+        sa.Column('tweet_id', sa.BigInteger(), nullable=False),
+        sa.Column('text', sa.String(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('author_id', sa.BigInteger(), nullable=True),
+        sa.Column('list_id', sa.BigInteger(), nullable=True),
+        sa.Column('author_username', sa.String(), nullable=True),
+        sa.Column('author_name', sa.String(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.execute("ALTER SEQUENCE tweets_id_seq OWNED BY tweets.id")
+    op.execute(f"INSERT INTO tweets ({COLUMNS}) SELECT {COLUMNS} FROM tweets_partitioned")
+    op.create_index('ix_tweets_tweet_id', 'tweets', ['tweet_id'], unique=True)
+    op.create_index('ix_tweets_list_id_tweet_id', 'tweets', ['list_id', 'tweet_id'])
+    op.create_index('ix_tweets_created_at', 'tweets', ['created_at'])
+    # Drops the partitions with it
+    op.drop_table('tweets_partitioned')
@@ -0,0 +1,46 @@
+"""add_event_unlock_columns
+
+Revision ID: 67979129e65b
+Revises: 40b3c9ef7ade
+Create Date: 2026-10-18 21:03:52.614208
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '67979129e65b'
+down_revision: Union[str, None] = '40b3c9ef7ade'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('events', sa.Column('token_symbol', sa.String(length=32), nullable=True))
+    op.add_column('events', sa.Column('amount_usd', sa.Float(), nullable=True))
+    # Same parsing as app.utils.text, for events synced before these columns existed
+    op.execute(
+        r"""
+        UPDATE events
+        SET token_symbol = upper(substring(title FROM '^CRYPTO:\s*(\S+)\s+Unlock')),
+            amount_usd = (
+                SELECT replace(m[1], ',', '')::float * CASE m[2]
+                    WHEN 'K' THEN 1e3
+                    WHEN 'M' THEN 1e6
+                    WHEN 'B' THEN 1e9
+                    ELSE 1
+                END
+                FROM regexp_match(description, '\$\s*([0-9][0-9,]*(?:\.[0-9]+)?)\s*([KMB])?') AS m
+            )
+        WHERE event_type = 'vesting'
+        """
+    )
+    op.create_index('ix_events_event_type_start', 'events', ['event_type', 'start'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_events_event_type_start', table_name='events')
+    op.drop_column('events', 'amount_usd')
+    op.drop_column('events', 'token_symbol')
@@ -0,0 +1,51 @@
+"""add_tweet_summary_marker
+
+Revision ID: 6daa31b3abc9
+Revises: b5e1eb022287
+Create Date: 2026-10-18 23:27:45.901336
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '6daa31b3abc9'
+down_revision: Union[str, None] = 'b5e1eb022287'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Nullable without a default: no rewrite of the tweet partitions
+    op.add_column('tweets', sa.Column('summary_id', sa.Integer(), nullable=True))
+    # Mark the tweets existing summaries covered: up to their row watermark,
+    # or for summaries older than watermarks, tweets stored before the last write
+    op.execute(
+        """
+        UPDATE tweets
+        SET summary_id = summaries.id
+        FROM summaries
+        WHERE tweets.created_at >= summaries.date_summarized
+          AND tweets.created_at < summaries.date_summarized + interval '1 day'
+          AND CASE
+              WHEN summaries.last_row_id IS NOT NULL THEN tweets.id <= summaries.last_row_id
+              ELSE tweets.created_at < coalesce(summaries.updated_at, summaries.created_at)
+          END
+        """
+    )
+    op.drop_column('summaries', 'last_row_id')
+
+
+def downgrade() -> None:
+    op.add_column('summaries', sa.Column('last_row_id', sa.Integer(), nullable=True))
+    op.execute(
+        """
+        UPDATE summaries
+        SET last_row_id = (
+            SELECT max(tweets.id) FROM tweets WHERE tweets.summary_id = summaries.id
+        )
+        """
+    )
+    op.drop_column('tweets', 'summary_id')
@@ -0,0 +1,52 @@
+"""add_tweet_day_stats
+
+Revision ID: 811b3a8636e9
+Revises: f18b193cf518
+Create Date: 2026-10-18 17:38:52.610471
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '811b3a8636e9'
+down_revision: Union[str, None] = 'f18b193cf518'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'tweet_day_stats',
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('list_id', sa.BigInteger(), autoincrement=False, nullable=False),
+        sa.Column('tweet_count', sa.Integer(), nullable=False),
+        sa.Column('min_tweet_id', sa.BigInteger(), nullable=True),
+        sa.Column('max_tweet_id', sa.BigInteger(), nullable=True),
+        sa.Column('summarised', sa.Boolean(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('day', 'list_id'),
+    )
+    # One last full scan of tweets; ingestion keeps the rollup current from here
+    op.execute(
+        """
+        INSERT INTO tweet_day_stats
+            (day, list_id, tweet_count, min_tweet_id, max_tweet_id, summarised, updated_at)
+        SELECT created_at::date, COALESCE(list_id, 0), count(*), min(tweet_id), max(tweet_id),
+               false, now() AT TIME ZONE 'utc'
+        FROM tweets
+        GROUP BY 1, 2
+        """
+    )
+    op.execute(
+        """
+        UPDATE tweet_day_stats SET summarised = true
+        WHERE day IN (SELECT date_summarized::date FROM summaries)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('tweet_day_stats')
@@ -0,0 +1,36 @@
+"""add_llm_cache
+
+Revision ID: a44cc8614297
+Revises: 4d5c2a78bd5d
+Create Date: 2026-10-18 15:02:19.774530
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'a44cc8614297'
+down_revision: Union[str, None] = '4d5c2a78bd5d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'llm_cache',
+        sa.Column('cache_key', sa.String(length=64), nullable=False),
+        sa.Column('model', sa.String(), nullable=False),
+        sa.Column('response_text', sa.Text(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('last_used_at', sa.DateTime(), nullable=False),
+        sa.Column('hit_count', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('cache_key'),
+    )
+    op.create_index(op.f('ix_llm_cache_last_used_at'), 'llm_cache', ['last_used_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_llm_cache_last_used_at'), table_name='llm_cache')
+    op.drop_table('llm_cache')
@@ -0,0 +1,39 @@
+"""add_summary_row_watermark
+
+Revision ID: b5e1eb022287
+Revises: 67979129e65b
+Create Date: 2026-10-18 22:41:07.385120
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5e1eb022287'
+down_revision: Union[str, None] = '67979129e65b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('summaries', sa.Column('last_row_id', sa.Integer(), nullable=True))
+    # Best effort for existing summaries: the newest row among the tweets they covered
+    op.execute(
+        """
+        UPDATE summaries
+        SET last_row_id = (
+            SELECT max(tweets.id)
+            FROM tweets
+            WHERE tweets.created_at >= summaries.date_summarized
+              AND tweets.created_at < summaries.date_summarized + interval '1 day'
+              AND tweets.tweet_id <= summaries.last_tweet_id
+        )
+        WHERE last_tweet_id IS NOT NULL
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('summaries', 'last_row_id')
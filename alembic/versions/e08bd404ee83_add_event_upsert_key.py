@@ -0,0 +1,43 @@
+"""add_event_upsert_key
+
+Revision ID: e08bd404ee83
+Revises: 811b3a8636e9
+Create Date: 2026-10-18 18:05:27.319846
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'e08bd404ee83'
+down_revision: Union[str, None] = '811b3a8636e9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keep the most recently updated row of each (title, start) before adding the key
+    op.execute(
+        """
+        DELETE FROM events
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT id, row_number() OVER (
+                    PARTITION BY title, start
+                    ORDER BY updated_at DESC NULLS LAST, id DESC
+                ) AS position
+                FROM events
+            ) ranked
+            WHERE position > 1
+        )
+        """
+    )
+    op.add_column('events', sa.Column('content_hash', sa.String(length=64), nullable=True))
+    op.create_unique_constraint('uq_events_title_start', 'events', ['title', 'start'])
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_events_title_start', 'events', type_='unique')
+    op.drop_column('events', 'content_hash')
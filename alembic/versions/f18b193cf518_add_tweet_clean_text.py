@@ -0,0 +1,27 @@
+"""add_tweet_clean_text
+
+Revision ID: f18b193cf518
+Revises: f66d0ed36356
+Create Date: 2026-10-18 17:02:11.482903
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'f18b193cf518'
+down_revision: Union[str, None] = 'f66d0ed36356'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Existing rows are filled by `python -m app.maintenance clean-text`,
+    # prompt building cleans them on the fly until then
+    op.add_column('tweets', sa.Column('clean_text', sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('tweets', 'clean_text')
@@ -0,0 +1,27 @@
+"""add_summary_watermark
+
+Revision ID: f66d0ed36356
+Revises: a44cc8614297
+Create Date: 2026-10-18 16:21:45.093817
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'f66d0ed36356'
+down_revision: Union[str, None] = 'a44cc8614297'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('summaries', sa.Column('last_tweet_id', sa.BigInteger(), nullable=True))
+    op.add_column('summaries', sa.Column('updated_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('summaries', 'updated_at')
+    op.drop_column('summaries', 'last_tweet_id')
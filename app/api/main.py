@@ -1,26 +1,105 @@
-from fastapi import FastAPI, Depends, HTTPException
+import logging
+from fastapi import FastAPI, Depends, HTTPException, Query, Request, Response
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.orm import Session
+from fastapi.responses import JSONResponse, StreamingResponse
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timedelta
-from typing import List
+from typing import List, Literal, Optional
 from pydantic import BaseModel
 
-from app.database.session import get_db
-from app.models.summary import Summary
-from app.models.tweet import Tweet
-from app.models.event import Event
+from app.api.pagination import (
+    NEXT_CURSOR_HEADER,
+    encode_cursor,
+    decode_cursor,
+    parse_fields,
+)
+from app.api.response_cache import cached_json_response, response_cache_stats
+from app.api.schemas import TweetResponse, TweetDayCount, SummaryResponse
+from app.cache import cache_stats
+from app.database.session import get_async_db, pool_stats
 from app.repositories import event_repository
-from app.services.scheduler import init_scheduler
+from app.repositories.summary_repository import get_summaries_page_async
+from app.repositories.tweet_repository import get_tweets_page_async
+from app.repositories.tweet_day_stats_repository import get_day_counts_async
+from app.services.export import export_stream
+from app.services.llm_cache import llm_cache_stats
+from app.services.scheduler import (
+    init_scheduler,
+    scheduler_stats,
+    calendar_sync_status,
+)
 from app.utils.config import Config
 
+logger = logging.getLogger(__name__)
+
 app = FastAPI()
 
 
 @app.on_event("startup")
 async def startup_event():
-    db = next(get_db())
     config = Config()
-    await init_scheduler(db, config)
+    # The first calendar sync is a scheduled job, so startup returns right away
+    app.state.scheduler = init_scheduler(config)
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    app.state.scheduler.shutdown(wait=False)
+
+
+@app.get("/health/live")
+async def health_live():
+    """The process is up and serving requests"""
+    return {"status": "ok"}
+
+
+@app.get("/health/jobs")
+async def health_jobs():
+    """Run counts, durations and next run times of the scheduled jobs"""
+    return scheduler_stats(app.state.scheduler)
+
+
+@app.get("/health/pool")
+async def health_pool():
+    """Connection pool saturation and checkout wait times"""
+    return pool_stats()
+
+
+@app.get("/health/cache")
+async def health_cache():
+    """Hit and miss counts per cache namespace, API 304s and the Postgres LLM cache"""
+    return {**cache_stats(), "api": response_cache_stats(), "llm_db": llm_cache_stats()}
+
+
+@app.get("/health/ready")
+async def health_ready(db: AsyncSession = Depends(get_async_db)):
+    """The database is reachable and calendar data is there, synced now or before"""
+    checks = {"database": True, "calendar": calendar_sync_status["last_success"] is not None}
+    try:
+        await db.execute(text("SELECT 1"))
+        if not checks["calendar"]:
+            # Events from earlier runs keep the calendar usable while a sync is failing
+            result = await db.execute(text("SELECT 1 FROM events LIMIT 1"))
+            checks["calendar"] = result.scalar() is not None
+    except Exception as e:
+        logger.error(f"Readiness database check failed: {str(e)}")
+        checks["database"] = False
+
+    ready = all(checks.values())
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={
+            "status": "ready" if ready else "starting",
+            "checks": checks,
+            "calendar_synced_at": (
+                calendar_sync_status["last_success"].isoformat()
+                if calendar_sync_status["last_success"]
+                else None
+            ),
+        },
+    )
 
 
 # CORS middleware for frontend
@@ -30,42 +109,125 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, "ETag"],
 )
 
 
-@app.get("/api/summaries/")
-def get_summaries(days: int = 30, db: Session = Depends(get_db)):
-    """Get summaries for the last N days"""
+def _next_cursor_headers(rows: List[dict], limit: int, key: str) -> dict:
+    """Point to the next page if this one is full"""
+    if len(rows) < limit:
+        return {}
+    return {NEXT_CURSOR_HEADER: encode_cursor(rows[-1][key], rows[-1]["id"])}
+
+
+@app.get(
+    "/api/summaries/",
+    response_model=List[SummaryResponse],
+    response_model_exclude_unset=True,
+)
+async def get_summaries(
+    request: Request,
+    days: int = 30,
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Get summaries for the last N days, most recent first.
+    Pages are keyed on (date_summarized, id); pass the X-Next-Cursor
+    response header as cursor for the next page. fields= selects columns,
+    e.g. fields=id,date_summarized to skip summary_text.
+    Cached until a summary is written, with ETag revalidation.
+    """
     end_date = datetime.utcnow()
     start_date = end_date - timedelta(days=days)
-
-    summaries = (
-        db.query(Summary)
-        .filter(Summary.date_summarized >= start_date)
-        .order_by(Summary.date_summarized.desc())
-        .all()
+    columns = parse_fields(
+        fields, list(SummaryResponse.model_fields), required=["id", "date_summarized"]
     )
-    return summaries
+    before = decode_cursor(cursor)
+
+    async def build():
+        rows = await get_summaries_page_async(db, start_date, limit, columns, before=before)
+        content = [
+            SummaryResponse.model_validate(row).model_dump(mode="json", exclude_unset=True)
+            for row in rows
+        ]
+        return content, _next_cursor_headers(rows, limit, "date_summarized")
+
+    return await cached_json_response(request, "summaries", build)
 
 
-@app.get("/api/tweets/{date}")
-def get_tweets_by_date(date: str, db: Session = Depends(get_db)):
-    """Get tweets for a specific date"""
+@app.get("/api/tweets/counts/", response_model=List[TweetDayCount])
+async def get_tweet_counts(days: int = 30, db: AsyncSession = Depends(get_async_db)):
+    """Get tweet counts per day for the last N days"""
+    end_date = datetime.utcnow().date() + timedelta(days=1)
+    start_date = end_date - timedelta(days=days)
+    return await get_day_counts_async(db, start_date, end_date)
+
+
+@app.get(
+    "/api/tweets/{date}",
+    response_model=List[TweetResponse],
+    response_model_exclude_unset=True,
+)
+async def get_tweets_by_date(
+    date: str,
+    response: Response,
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Get tweets for a specific date, newest first.
+    Pages are keyed on (created_at, id); pass the X-Next-Cursor response
+    header as cursor for the next page. fields= selects columns.
+    """
     try:
         target_date = datetime.strptime(date, "%Y-%m-%d")
-        end_date = target_date + timedelta(days=1)
-
-        tweets = (
-            db.query(Tweet)
-            .filter(Tweet.created_at >= target_date)
-            .filter(Tweet.created_at < end_date)
-            .order_by(Tweet.created_at.desc())
-            .all()
-        )
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid date format")
+    end_date = target_date + timedelta(days=1)
+    columns = parse_fields(
+        fields, list(TweetResponse.model_fields), required=["id", "created_at"]
+    )
+
+    rows = await get_tweets_page_async(
+        db, target_date, end_date, limit, columns, before=decode_cursor(cursor)
+    )
+    response.headers.update(_next_cursor_headers(rows, limit, "created_at"))
+    return rows
+
+
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
 
-        return tweets
+
+@app.get("/api/export")
+async def export(
+    resource: Literal["tweets", "summaries", "events"],
+    start: str,
+    end: str,
+    format: Literal["ndjson", "csv"] = "ndjson",
+):
+    """
+    Stream tweets, summaries or events dated from start up to (not
+    including) end, as NDJSON or CSV. Dates are YYYY-MM-DD.
+    """
+    try:
+        start_date = datetime.strptime(start, "%Y-%m-%d")
+        end_date = datetime.strptime(end, "%Y-%m-%d")
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid date format")
+    if end_date <= start_date:
+        raise HTTPException(status_code=400, detail="end must be after start")
+
+    filename = f"{resource}_{start}_{end}.{format}"
+    return StreamingResponse(
+        export_stream(resource, start_date, end_date, format, Config.EXPORT_BATCH_SIZE),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
 
 
 class EventCreate(BaseModel):
@@ -76,15 +238,15 @@ class EventCreate(BaseModel):
 
 
 @app.post("/api/events/")
-def create_event(
+async def create_event(
     event: EventCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     print(
         f"Creating event: {event.title}, {event.description}, {event.start}, {event.end}"
     )
     try:
-        event = event_repository.create_event(
+        event = await event_repository.create_event_async(
             db=db,
             title=event.title,
             description=event.description,
@@ -98,13 +260,13 @@ def create_event(
 
 # Update event
 @app.put("/api/events/{event_id}")
-def update_event(
+async def update_event(
     event_id: int,
     event: EventCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     try:
-        updated_event = event_repository.update_event(
+        updated_event = await event_repository.update_event_async(
             db,
             event_id,
             title=event.title,
@@ -121,9 +283,9 @@ def update_event(
 
 # delete event
 @app.delete("/api/events/{event_id}")
-def delete_event(event_id: int, db: Session = Depends(get_db)):
+async def delete_event(event_id: int, db: AsyncSession = Depends(get_async_db)):
     try:
-        event_repository.delete_event(db, event_id)
+        await event_repository.delete_event_async(db, event_id)
         return {"message": "Event deleted successfully"}
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -131,7 +293,37 @@ def delete_event(event_id: int, db: Session = Depends(get_db)):
 
 # get all events
 @app.get("/api/events/")
-def get_events(db: Session = Depends(get_db)):
-    events = event_repository.get_all_events(db)
-    # Filter out small daily unlocks for vesting events
-    return events
+async def get_events(
+    request: Request,
+    event_type: Optional[str] = None,
+    tokens: Optional[str] = Query(None, description="Comma-separated token symbols"),
+    min_amount_usd: Optional[float] = Query(None, ge=0),
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Events, latest first, optionally filtered by type, unlock token, unlock
+    size in USD and a start date window (YYYY-MM-DD, end excluded).
+    Cached per URL until an event is written, with ETag revalidation.
+    """
+    try:
+        start_date = datetime.strptime(start, "%Y-%m-%d") if start else None
+        end_date = datetime.strptime(end, "%Y-%m-%d") if end else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid date format")
+    token_list = [token.strip() for token in tokens.split(",") if token.strip()] if tokens else None
+
+    async def build():
+        events = await event_repository.get_all_events_async(
+            db,
+            event_type=event_type,
+            tokens=token_list,
+            min_amount_usd=min_amount_usd,
+            start=start_date,
+            end=end_date,
+            hidden_tokens=Config.HIDDEN_VESTING_TOKENS,
+        )
+        return jsonable_encoder(events), {}
+
+    return await cached_json_response(request, "events", build)
@@ -0,0 +1,106 @@
+import hashlib
+import json
+import logging
+import threading
+from collections import defaultdict
+from typing import Awaitable, Callable, Dict, Tuple
+
+from fastapi import Request, Response
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.cache import cache_stats, get_cache
+from app.utils.config import Config
+
+logger = logging.getLogger(__name__)
+
+# Bumped when a commit in this process touches the table. Writers in other
+# processes (e.g. the CLI) are picked up when entries expire after the TTL.
+table_versions = defaultdict(int)
+_versions_lock = threading.Lock()
+
+
+def _pending_tables(session) -> set:
+    return session.info.setdefault("changed_tables", set())
+
+
+@event.listens_for(Session, "after_flush")
+def _track_flushed_tables(session, flush_context):
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        _pending_tables(session).add(instance.__table__.name)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_bulk_statements(orm_execute_state):
+    # insert()/update()/delete() statements bypass the unit of work, e.g. upsert_events
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        table = orm_execute_state.statement.table
+        _pending_tables(orm_execute_state.session).add(table.name)
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_table_versions(session):
+    tables = session.info.pop("changed_tables", None)
+    if tables:
+        with _versions_lock:
+            for table in tables:
+                table_versions[table] += 1
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_table_changes(session):
+    session.info.pop("changed_tables", None)
+
+
+# Keys embed this process's table versions, so entries must not be shared with
+# other processes through Redis
+response_cache = get_cache(
+    "api",
+    default_ttl=Config.RESPONSE_CACHE_TTL_SECONDS,
+    max_entries=Config.RESPONSE_CACHE_MAX_ENTRIES,
+    local=True,
+)
+_not_modified = 0
+
+
+def response_cache_stats() -> dict:
+    return {**cache_stats().get("api", {}), "not_modified": _not_modified}
+
+
+async def cached_json_response(
+    request: Request,
+    table: str,
+    build: Callable[[], Awaitable[Tuple[object, Dict[str, str]]]],
+) -> Response:
+    """
+    Serve a JSON response from the "api" cache namespace, or build it and
+    cache it; concurrent misses for the same URL share one build.
+    build returns the JSON-ready content and extra headers. Requests whose
+    If-None-Match matches the ETag get a 304 without a body.
+    """
+    global _not_modified
+
+    async def build_entry() -> dict:
+        content, headers = await build()
+        body = json.dumps(content, ensure_ascii=False, separators=(",", ":"))
+        return {
+            "body": body,
+            # Content hash, so an ETag is never reused for a different body
+            "etag": f'"{hashlib.sha256(body.encode()).hexdigest()[:32]}"',
+            "headers": headers,
+        }
+
+    # The table version is part of the key, so a write makes old entries unreachable
+    key = f"{table}:{table_versions[table]}:{request.url}"
+    entry = await response_cache.aget_or_set(key, build_entry)
+
+    headers = {
+        **entry["headers"],
+        "ETag": entry["etag"],
+        # Let browsers keep the body but revalidate on every load
+        "Cache-Control": "no-cache",
+    }
+    if request.headers.get("if-none-match") == entry["etag"]:
+        _not_modified += 1
+        return Response(status_code=304, headers=headers)
+    return Response(content=entry["body"], media_type="application/json", headers=headers)
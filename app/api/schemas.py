@@ -0,0 +1,46 @@
+from datetime import date, datetime
+from typing import Optional
+from pydantic import BaseModel, ConfigDict, field_validator
+
+
+class TweetResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    # Snowflake IDs exceed JavaScript's safe integer range, so send them as strings
+    tweet_id: Optional[str] = None
+    text: Optional[str] = None
+    created_at: Optional[datetime] = None
+    author_id: Optional[str] = None
+    list_id: Optional[str] = None
+    author_username: Optional[str] = None
+    author_name: Optional[str] = None
+
+    @field_validator("tweet_id", "author_id", "list_id", mode="before")
+    @classmethod
+    def id_to_str(cls, value):
+        return str(value) if value is not None else None
+
+
+class TweetDayCount(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    date: date
+    tweet_count: int
+    summarised: bool
+
+
+class SummaryResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    date_summarized: datetime
+    summary_text: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    last_tweet_id: Optional[str] = None
+
+    @field_validator("last_tweet_id", mode="before")
+    @classmethod
+    def id_to_str(cls, value):
+        return str(value) if value is not None else None
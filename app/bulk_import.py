@@ -0,0 +1,228 @@
+"""
+Bulk import tweets from JSON or NDJSON archives using PostgreSQL COPY.
+
+Usage: python -m app.bulk_import <file> [list_id]
+"""
+
+import csv
+import io
+import json
+import logging
+import sys
+import time
+from datetime import datetime, timezone
+
+from app.database.session import engine, session_scope
+from app.repositories.tweet_day_stats_repository import ROLLUP_UPSERT_SQL
+from app.services.tweet_partitions import ensure_tweet_partitions
+from app.utils import setup_logger
+from app.utils.config import Config
+from app.utils.text import clean_tweet_text
+
+logger = logging.getLogger(__name__)
+
+STAGING_COLUMNS = [
+    "tweet_id",
+    "text",
+    "clean_text",
+    "created_at",
+    "author_id",
+    "list_id",
+    "author_username",
+    "author_name",
+]
+
+CREATE_STAGING_SQL = """
+CREATE TEMP TABLE tweets_staging (
+    tweet_id bigint,
+    text text,
+    clean_text text,
+    created_at timestamp,
+    author_id bigint,
+    list_id bigint,
+    author_username text,
+    author_name text
+) ON COMMIT DROP
+"""
+
+COPY_SQL = (
+    f"COPY tweets_staging ({', '.join(STAGING_COLUMNS)}) FROM STDIN WITH (FORMAT csv)"
+)
+
+# Inserted tweets are added to the tweet_day_stats rollup in the same statement
+MERGE_SQL = f"""
+WITH inserted AS (
+    INSERT INTO tweets ({', '.join(STAGING_COLUMNS)})
+    SELECT DISTINCT ON (tweet_id) {', '.join(STAGING_COLUMNS)}
+    FROM tweets_staging
+    WHERE tweet_id IS NOT NULL AND created_at IS NOT NULL
+    ON CONFLICT (tweet_id, created_at) DO NOTHING
+    RETURNING tweet_id, created_at, list_id
+), rollup AS (
+    {ROLLUP_UPSERT_SQL.format(source="inserted")}
+)
+SELECT count(*) FROM inserted
+"""
+
+
+def _iter_json_array(f, chunk_size: int = 1 << 16):
+    """Yield the elements of a top-level JSON array without loading the whole file"""
+    decoder = json.JSONDecoder()
+    buffer = f.read(chunk_size).lstrip()
+    if not buffer.startswith("["):
+        raise ValueError("Expected a JSON array")
+    buffer = buffer[1:]
+
+    while True:
+        buffer = buffer.lstrip()
+        if buffer.startswith(","):
+            buffer = buffer[1:].lstrip()
+        if buffer.startswith("]"):
+            return
+        if buffer:
+            try:
+                record, end = decoder.raw_decode(buffer)
+                yield record
+                buffer = buffer[end:]
+                continue
+            except json.JSONDecodeError:
+                pass  # Record spans the next chunk
+
+        chunk = f.read(chunk_size)
+        if not chunk:
+            if buffer.strip():
+                raise ValueError("Unexpected end of JSON array")
+            return
+        buffer += chunk
+
+
+def iter_tweet_records(path: str):
+    """Stream tweet dicts from a JSON array or NDJSON file"""
+    with open(path, "r", encoding="utf-8") as f:
+        first_char = ""
+        while not first_char.strip():
+            first_char = f.read(1)
+            if not first_char:
+                return
+        f.seek(0)
+
+        if first_char == "[":
+            yield from _iter_json_array(f)
+        else:
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+
+
+def _optional_str(value):
+    return str(value) if value is not None else None
+
+
+def _to_utc_naive(value):
+    """Parse an ISO timestamp and store it as naive UTC like the ORM does"""
+    if not value:
+        return None
+    dt = datetime.fromisoformat(value) if isinstance(value, str) else value
+    if dt.tzinfo:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt
+
+
+def normalise_tweet_record(record: dict, list_id=None) -> dict:
+    """
+    Map an archived tweet to Tweet columns.
+    Accepts the flat convert_to_serializable format as well as the
+    nested "author" format of sample_tweets.json.
+    """
+    author = record.get("author") or {}
+    return {
+        "tweet_id": _optional_str(record.get("id", record.get("tweet_id"))),
+        "text": record.get("text"),
+        "clean_text": clean_tweet_text(record.get("text")),
+        "created_at": _to_utc_naive(record.get("created_at")),
+        "author_id": _optional_str(record.get("author_id") or author.get("id")),
+        "list_id": _optional_str(record.get("list_id") or list_id),
+        "author_username": record.get("author_username") or author.get("username"),
+        "author_name": record.get("author_name") or author.get("name"),
+    }
+
+
+def _copy_batch(cursor, rows: list):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        if row["created_at"]:
+            row["created_at"] = row["created_at"].isoformat()
+        writer.writerow([row[col] for col in STAGING_COLUMNS])
+    buffer.seek(0)
+    cursor.copy_expert(COPY_SQL, buffer)
+
+
+def import_tweets(path: str, list_id=None, batch_size: int = None) -> dict:
+    """
+    Load a tweet archive into the tweets table.
+    Rows are streamed into a temporary staging table with COPY FROM STDIN
+    and merged into tweets in one statement, skipping stored tweet_ids.
+    Returns dict with rows read, rows inserted and throughput.
+    """
+    batch_size = batch_size or Config.BULK_IMPORT_BATCH_SIZE
+    started = time.perf_counter()
+    rows_read = 0
+
+    connection = engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+        cursor.execute(CREATE_STAGING_SQL)
+
+        batch = []
+        for record in iter_tweet_records(path):
+            batch.append(normalise_tweet_record(record, list_id))
+            if len(batch) >= batch_size:
+                _copy_batch(cursor, batch)
+                rows_read += len(batch)
+                logger.info(f"Staged {rows_read} tweets")
+                batch = []
+        if batch:
+            _copy_batch(cursor, batch)
+            rows_read += len(batch)
+
+        load_seconds = time.perf_counter() - started
+        # Archives reach back further than the partitions made at startup
+        cursor.execute("SELECT min(created_at) FROM tweets_staging")
+        oldest = cursor.fetchone()[0]
+        if oldest:
+            with session_scope() as db:
+                ensure_tweet_partitions(
+                    db, months_ahead=Config.TWEET_PARTITION_MONTHS_AHEAD, start=oldest
+                )
+        cursor.execute(MERGE_SQL)
+        rows_inserted = cursor.fetchone()[0]
+        connection.commit()
+    except Exception as e:
+        logger.error(f"Error importing tweets from {path}: {str(e)}")
+        connection.rollback()
+        raise
+    finally:
+        connection.close()
+
+    elapsed = time.perf_counter() - started
+    rows_per_second = round(rows_read / elapsed) if elapsed else rows_read
+    logger.info(
+        f"Imported {rows_inserted}/{rows_read} tweets from {path} in {elapsed:.2f}s "
+        f"(staging {load_seconds:.2f}s, {rows_per_second} rows/s)"
+    )
+    return {
+        "rows_read": rows_read,
+        "rows_inserted": rows_inserted,
+        "seconds": round(elapsed, 2),
+        "rows_per_second": rows_per_second,
+    }
+
+
+if __name__ == "__main__":
+    setup_logger()
+    if len(sys.argv) < 2:
+        print("Usage: python -m app.bulk_import <file> [list_id]")
+        sys.exit(1)
+    import_tweets(sys.argv[1], list_id=sys.argv[2] if len(sys.argv) > 2 else None)
@@ -0,0 +1,64 @@
+"""
+Caching shared by the API and services.
+
+    from app.cache import get_cache
+    cache = get_cache("token_unlocks")
+    value = await cache.aget_or_set(key, load, ttl=3600)
+
+The backend is chosen by CACHE_BACKEND: "memory" (in-process LRU per
+namespace, the default) or "redis" (REDIS_URL, shared between processes).
+"""
+
+import threading
+from pathlib import Path
+
+from app.cache.backends import CacheBackend, FileBackend, MemoryBackend, RedisBackend
+from app.cache.cache import Cache, cache_stats
+from app.utils.config import Config
+
+_redis_backend = None
+_caches = {}  # namespace -> Cache
+_caches_lock = threading.Lock()
+
+
+def get_cache(
+    namespace: str,
+    default_ttl: int = None,
+    max_entries: int = None,
+    local: bool = False,
+    persistent: bool = False,
+) -> Cache:
+    """
+    Cache for a namespace, created on first use and shared afterwards, so
+    single-flight covers every caller in the process.
+    With CACHE_BACKEND=redis all namespaces share Redis, except local ones,
+    which stay in process memory. Otherwise each namespace gets its own LRU
+    of max_entries (default CACHE_MAX_ENTRIES), so busy namespaces don't
+    evict the others, and persistent ones are kept in files under CACHE_DIR.
+    """
+    global _redis_backend
+    with _caches_lock:
+        cache = _caches.get(namespace)
+        if cache is None:
+            if Config.CACHE_BACKEND == "redis" and not local:
+                if _redis_backend is None:
+                    _redis_backend = RedisBackend(Config.REDIS_URL)
+                backend = _redis_backend
+            elif persistent and not local:
+                backend = FileBackend(Path(Config.CACHE_DIR) / namespace)
+            else:
+                backend = MemoryBackend(max_entries=max_entries or Config.CACHE_MAX_ENTRIES)
+            cache = Cache(backend, namespace, default_ttl or Config.CACHE_DEFAULT_TTL_SECONDS)
+            _caches[namespace] = cache
+        return cache
+
+
+__all__ = [
+    "Cache",
+    "CacheBackend",
+    "FileBackend",
+    "MemoryBackend",
+    "RedisBackend",
+    "cache_stats",
+    "get_cache",
+]
@@ -0,0 +1,148 @@
+import asyncio
+from abc import ABC, abstractmethod
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class CacheBackend(ABC):
+    """
+    Key/value store for serialised (str) values with a per-key TTL.
+    Async methods default to the sync ones, which suits non-blocking backends.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: str, ttl_seconds: int):
+        pass
+
+    @abstractmethod
+    def delete(self, key: str):
+        pass
+
+    async def aget(self, key: str) -> Optional[str]:
+        return self.get(key)
+
+    async def aset(self, key: str, value: str, ttl_seconds: int):
+        self.set(key, value, ttl_seconds)
+
+    async def adelete(self, key: str):
+        self.delete(key)
+
+
+class MemoryBackend(CacheBackend):
+    """In-process LRU with per-entry expiry"""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str, ttl_seconds: int):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class RedisBackend(CacheBackend):
+    """Redis, shared by every process using the same URL (e.g. a local redis-server)"""
+
+    def __init__(self, url: str):
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError("CACHE_BACKEND=redis requires the redis package")
+        self.url = url
+        self.client = redis.Redis.from_url(url, decode_responses=True)
+        # redis.asyncio connections belong to one event loop, so keep a client per loop
+        self._async_clients = {}
+
+    def _async_client(self):
+        import redis.asyncio
+
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            client = redis.asyncio.Redis.from_url(self.url, decode_responses=True)
+            self._async_clients[loop] = client
+        return client
+
+    def get(self, key: str) -> Optional[str]:
+        return self.client.get(key)
+
+    def set(self, key: str, value: str, ttl_seconds: int):
+        self.client.set(key, value, ex=ttl_seconds)
+
+    def delete(self, key: str):
+        self.client.delete(key)
+
+    async def aget(self, key: str) -> Optional[str]:
+        return await self._async_client().get(key)
+
+    async def aset(self, key: str, value: str, ttl_seconds: int):
+        await self._async_client().set(key, value, ex=ttl_seconds)
+
+    async def adelete(self, key: str):
+        await self._async_client().delete(key)
+
+
+class FileBackend(CacheBackend):
+    """One JSON file per key in a directory, so entries survive restarts"""
+
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{hashlib.sha256(key.encode()).hexdigest()[:32]}.json"
+
+    def get(self, key: str) -> Optional[str]:
+        try:
+            with open(self._path(key)) as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        if entry["expires_at"] < time.time():
+            return None
+        return entry["value"]
+
+    def set(self, key: str, value: str, ttl_seconds: int):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({"key": key, "expires_at": time.time() + ttl_seconds, "value": value}, f)
+        tmp_path.replace(path)
+
+    def delete(self, key: str):
+        self._path(key).unlink(missing_ok=True)
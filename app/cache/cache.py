@@ -0,0 +1,191 @@
+import asyncio
+import json
+import logging
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Optional
+
+from app.cache.backends import CacheBackend
+
+logger = logging.getLogger(__name__)
+
+# Per-namespace counters, shared by every Cache instance in the process
+_metrics = defaultdict(
+    lambda: {
+        "hits": 0,
+        "misses": 0,
+        "sets": 0,
+        "loads": 0,  # Factory calls made on a miss
+        "coalesced": 0,  # Hits that waited for another caller's load
+        "load_seconds": 0.0,
+        "errors": 0,
+    }
+)
+_metrics_lock = threading.Lock()
+
+
+def cache_stats() -> dict:
+    with _metrics_lock:
+        return {
+            namespace: {**metrics, "load_seconds": round(metrics["load_seconds"], 3)}
+            for namespace, metrics in _metrics.items()
+        }
+
+
+class Cache:
+    """
+    Namespaced view of a backend with JSON values and hit/miss metrics.
+    get_or_set/aget_or_set are single-flight: concurrent misses on a key
+    wait for one load instead of all calling the factory.
+    Backend errors are logged and treated as misses.
+    """
+
+    def __init__(self, backend: CacheBackend, namespace: str, default_ttl: int = 300):
+        self.backend = backend
+        self.namespace = namespace
+        self.default_ttl = default_ttl
+        self._key_locks = {}  # key -> [lock, users]
+        self._key_locks_lock = threading.Lock()
+        self._inflight = {}  # key -> asyncio.Future
+
+    def _key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    def _record(self, name: str, amount=1):
+        with _metrics_lock:
+            _metrics[self.namespace][name] += amount
+
+    def _decode(self, raw: Optional[str]) -> Any:
+        self._record("hits" if raw is not None else "misses")
+        return json.loads(raw) if raw is not None else None
+
+    # Sync interface
+
+    def _get_raw(self, key: str) -> Optional[str]:
+        try:
+            return self.backend.get(self._key(key))
+        except Exception as e:
+            logger.error(f"Cache get failed for {self._key(key)}: {str(e)}")
+            self._record("errors")
+            return None
+
+    def get(self, key: str) -> Any:
+        return self._decode(self._get_raw(key))
+
+    def set(self, key: str, value: Any, ttl: int = None):
+        try:
+            self.backend.set(self._key(key), json.dumps(value), ttl or self.default_ttl)
+            self._record("sets")
+        except Exception as e:
+            logger.error(f"Cache set failed for {self._key(key)}: {str(e)}")
+            self._record("errors")
+
+    def delete(self, key: str):
+        try:
+            self.backend.delete(self._key(key))
+        except Exception as e:
+            logger.error(f"Cache delete failed for {self._key(key)}: {str(e)}")
+            self._record("errors")
+
+    def get_or_set(self, key: str, factory: Callable[[], Any], ttl: int = None) -> Any:
+        raw = self._get_raw(key)
+        if raw is not None:
+            return self._decode(raw)
+
+        with self._key_locks_lock:
+            entry = self._key_locks.setdefault(key, [threading.Lock(), 0])
+            entry[1] += 1
+        try:
+            with entry[0]:
+                # Another thread may have loaded it while we waited
+                raw = self._get_raw(key)
+                if raw is not None:
+                    self._record("coalesced")
+                    return self._decode(raw)
+                self._record("misses")
+                return self._load(key, factory, ttl)
+        finally:
+            with self._key_locks_lock:
+                entry[1] -= 1
+                if not entry[1]:
+                    del self._key_locks[key]
+
+    def _load(self, key: str, factory: Callable[[], Any], ttl: int = None) -> Any:
+        started = time.perf_counter()
+        value = factory()
+        self._record("loads")
+        self._record("load_seconds", time.perf_counter() - started)
+        if value is not None:
+            self.set(key, value, ttl)
+        return value
+
+    # Async interface
+
+    async def _aget_raw(self, key: str) -> Optional[str]:
+        try:
+            return await self.backend.aget(self._key(key))
+        except Exception as e:
+            logger.error(f"Cache get failed for {self._key(key)}: {str(e)}")
+            self._record("errors")
+            return None
+
+    async def aget(self, key: str) -> Any:
+        return self._decode(await self._aget_raw(key))
+
+    async def aset(self, key: str, value: Any, ttl: int = None):
+        try:
+            await self.backend.aset(self._key(key), json.dumps(value), ttl or self.default_ttl)
+            self._record("sets")
+        except Exception as e:
+            logger.error(f"Cache set failed for {self._key(key)}: {str(e)}")
+            self._record("errors")
+
+    async def adelete(self, key: str):
+        try:
+            await self.backend.adelete(self._key(key))
+        except Exception as e:
+            logger.error(f"Cache delete failed for {self._key(key)}: {str(e)}")
+            self._record("errors")
+
+    async def aget_or_set(
+        self, key: str, factory: Callable[[], Awaitable[Any]], ttl: int = None
+    ) -> Any:
+        raw = await self._aget_raw(key)
+        if raw is not None:
+            return self._decode(raw)
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self._record("hits")
+            self._record("coalesced")
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise  # This caller was cancelled
+                # The leading load was cancelled; load it here instead
+                return await self.aget_or_set(key, factory, ttl)
+
+        self._record("misses")
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            started = time.perf_counter()
+            value = await factory()
+            self._record("loads")
+            self._record("load_seconds", time.perf_counter() - started)
+            if value is not None:
+                await self.aset(key, value, ttl)
+            future.set_result(value)
+            return value
+        except Exception as e:
+            future.set_exception(e)
+            # Waiters get the exception; mark it retrieved for the case of none
+            future.exception()
+            raise
+        finally:
+            # Cancelled loads (client gone, shutdown) must not leave waiters hanging
+            if not future.done():
+                future.cancel()
+            del self._inflight[key]
@@ -1,14 +1,141 @@
+from contextlib import contextmanager
+import threading
+import time
 from sqlalchemy import create_engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
 from app.utils.config import Config
 
-engine = create_engine(Config.DATABASE_URL)
+
+class MeteredPoolMixin:
+    """Record checkout latency: waiting for a free connection, or opening a new one"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkout_stats = {
+            "checkouts": 0,
+            "timeouts": 0,
+            "wait_ms_total": 0.0,
+            "wait_ms_max": 0.0,
+        }
+        self._checkout_stats_lock = threading.Lock()
+
+    def _do_get(self):
+        started = time.perf_counter()
+        timed_out = False
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            timed_out = True
+            raise
+        finally:
+            wait_ms = (time.perf_counter() - started) * 1000
+            with self._checkout_stats_lock:
+                self.checkout_stats["checkouts"] += 1
+                self.checkout_stats["timeouts"] += int(timed_out)
+                self.checkout_stats["wait_ms_total"] += wait_ms
+                self.checkout_stats["wait_ms_max"] = max(
+                    self.checkout_stats["wait_ms_max"], wait_ms
+                )
+
+    def recreate(self):
+        # Keep the metrics when the pool is rebuilt, e.g. after a dispose()
+        pool = super().recreate()
+        pool.checkout_stats = self.checkout_stats
+        return pool
+
+
+class MeteredQueuePool(MeteredPoolMixin, QueuePool):
+    pass
+
+
+class MeteredAsyncQueuePool(MeteredPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+POOL_OPTIONS = {
+    "pool_size": Config.DB_POOL_SIZE,
+    "max_overflow": Config.DB_MAX_OVERFLOW,
+    "pool_timeout": Config.DB_POOL_TIMEOUT,
+    "pool_recycle": Config.DB_POOL_RECYCLE,
+    "pool_pre_ping": Config.DB_POOL_PRE_PING,
+}
+
+# No statement timeout here: ingestion, bulk imports and maintenance run
+# long statements on this engine
+engine = create_engine(
+    Config.DATABASE_URL,
+    poolclass=MeteredQueuePool,
+    **POOL_OPTIONS,
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine for the API, so requests don't queue behind the threadpool.
+# Request queries are bounded by the statement timeout.
+async_engine = create_async_engine(
+    Config.ASYNC_DATABASE_URL,
+    poolclass=MeteredAsyncQueuePool,
+    connect_args={
+        "server_settings": {"statement_timeout": str(Config.DB_STATEMENT_TIMEOUT_MS)}
+    },
+    **POOL_OPTIONS,
+)
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, autoflush=False, expire_on_commit=False
+)
 
-def get_db():
-    db = SessionLocal()
+
+@contextmanager
+def session_scope(session_factory=SessionLocal):
+    """
+    Unit of work: a session that commits on success, rolls back on error
+    and always returns its connection to the pool.
+    """
+    db = session_factory()
     try:
         yield db
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
     finally:
         db.close()
+
+
+def get_db():
+    with session_scope() as db:
+        yield db
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def _pool_stats(pool) -> dict:
+    capacity = pool.size() + pool._max_overflow
+    stats = dict(getattr(pool, "checkout_stats", {}))
+    checkouts = stats.get("checkouts", 0)
+    stats["wait_ms_avg"] = round(stats.pop("wait_ms_total", 0.0) / checkouts, 3) if checkouts else 0.0
+    stats["wait_ms_max"] = round(stats.get("wait_ms_max", 0.0), 3)
+    stats.update(
+        {
+            "size": pool.size(),
+            "max_overflow": pool._max_overflow,
+            "checked_out": pool.checkedout(),
+            "idle": pool.checkedin(),
+            # Share of all allowed connections in use; at 1.0 checkouts start to wait
+            "saturation": round(pool.checkedout() / capacity, 3) if capacity else 0.0,
+        }
+    )
+    return stats
+
+
+def pool_stats() -> dict:
+    """Connection pool usage and checkout latency for the sync and async engines"""
+    return {
+        "sync": _pool_stats(engine.pool),
+        "async": _pool_stats(async_engine.sync_engine.pool),
+    }
@@ -1,10 +1,11 @@
-import tweepy
 import colorama
 from app.tweetformater import TweetFormatter
 from app.utils.config import Config
 from app.models.tweet import Base, Tweet
-from app.database.session import engine, SessionLocal
-from app.services.tweet_service import update_list_tweets
+from app.database.session import engine, session_scope
+from app.services.ingestion import run_ingestion_cycle
+from app.services.tweet_service import create_twitter_client
+from app.services.tweet_partitions import ensure_tweet_partitions
 from app.repositories.tweet_repository import (
     get_recent_tweets,
     get_tweets_by_list,
@@ -18,12 +19,9 @@ from app.services.economic_calendar import EconomicCalendar
 # Set up logging with colors
 logger = setup_logger()
 
-# Initialize database and colorama
-db = SessionLocal()
+# Initialize colorama
 colorama.init()
 
-# Initialize the service
-
 
 def main():
     try:
@@ -31,19 +29,14 @@ def main():
         # config = Config(local_test=True)
         config = Config(local_test=False)
 
-        openai_service = OpenAIService(db, config)
         # twitter_service = TwitterService(db, config) // TODO: add twitter service
 
-        client = tweepy.Client(
-            bearer_token=config.BEARER_TOKEN,
-            consumer_key=config.API_KEY,
-            consumer_secret=config.API_SECRET_KEY,
-            access_token=config.ACCESS_TOKEN,
-            access_token_secret=config.ACCESS_TOKEN_SECRET,
-        )
+        client = create_twitter_client(config)
 
         # Create database tables if they don't exist
         Base.metadata.create_all(bind=engine)
+        with session_scope() as db:
+            ensure_tweet_partitions(db, months_ahead=config.TWEET_PARTITION_MONTHS_AHEAD)
 
         # Initialize formatter for display
         formatter = TweetFormatter(client=client)
@@ -52,24 +45,24 @@ def main():
             # In local test mode, just fetch from DB
             # Normal mode - fetch from API and update DB
             logger.info("--- Fetching new tweets from API ---")
-            for list_id in config.TWITTER_LISTS:
-                new_tweets_count = update_list_tweets(
-                    client=client, db=db, list_id=list_id
-                )
+            results = run_ingestion_cycle(client, config)
+            new_tweets_count = sum(r["new_tweets"] for r in results)
             logger.info(f"--- Saved {new_tweets_count} new tweets ---")
 
-        # Get all tweets for display
-        display_tweets = get_tweets(db=db, limit=5)
+        with session_scope() as db:
+            # Get all tweets for display
+            display_tweets = get_tweets(db=db, limit=5)
 
-        # Display tweets using formatter
-        if display_tweets:
-            logger.info(f"--- Displaying {len(display_tweets)} tweets ---")
-            formatter.format_style(display_tweets)
-        else:
-            logger.info("--- No tweets to display, database is empty ---")
+            # Display tweets using formatter
+            if display_tweets:
+                logger.info(f"--- Displaying {len(display_tweets)} tweets ---")
+                formatter.format_style(display_tweets)
+            else:
+                logger.info("--- No tweets to display, database is empty ---")
 
-        # Get summary with default prompt
-        summary = openai_service.get_daily_summary()
+            # Get today's summary, folding in tweets since the last run
+            openai_service = OpenAIService(db, config)
+            summary = openai_service.refresh_daily_summary()
 
         if summary:
             logger.info("\n=== Daily Tweet Summary ===")
@@ -80,23 +73,18 @@ def main():
 
     except Exception as e:
         logger.error(f"--- Error in main: {str(e)} ---")
-    finally:
-        db.close()
 
 
 def process_historical_summaries(max_days=None):
     """CLI function to process historical summaries"""
     try:
         config = Config()
-        db = SessionLocal()
-        openai_service = OpenAIService(db, config)
-
-        openai_service.process_missing_summaries(max_days=max_days)
+        with session_scope() as db:
+            openai_service = OpenAIService(db, config)
+            openai_service.process_missing_summaries(max_days=max_days)
 
     except Exception as e:
         logger.error(f"Error processing historical summaries: {str(e)}")
-    finally:
-        db.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,92 @@
+"""
+Database maintenance commands.
+
+Usage:
+    python -m app.maintenance partitions [--archive]
+    python -m app.maintenance clean-text
+"""
+
+import logging
+import sys
+
+from sqlalchemy import tuple_
+
+from app.database.session import session_scope
+from app.models.tweet import Tweet
+from app.services.tweet_partitions import (
+    ensure_tweet_partitions,
+    archive_tweet_partitions,
+)
+from app.utils import setup_logger
+from app.utils.config import Config
+from app.utils.text import clean_tweet_texts
+
+logger = logging.getLogger(__name__)
+
+
+def maintain_tweet_partitions(archive: bool = False):
+    """Create upcoming tweet partitions and optionally archive old ones"""
+    try:
+        with session_scope() as db:
+            ensure_tweet_partitions(db, months_ahead=Config.TWEET_PARTITION_MONTHS_AHEAD)
+
+            if archive:
+                if not Config.TWEET_ARCHIVE_AFTER_MONTHS:
+                    logger.info("TWEET_ARCHIVE_AFTER_MONTHS not set, skipping archive")
+                else:
+                    archive_tweet_partitions(
+                        db,
+                        older_than_months=Config.TWEET_ARCHIVE_AFTER_MONTHS,
+                        schema=Config.TWEET_ARCHIVE_SCHEMA,
+                    )
+    except Exception as e:
+        logger.error(f"Error maintaining tweet partitions: {str(e)}")
+
+
+def backfill_clean_text(batch_size: int = 1000) -> int:
+    """
+    Fill clean_text for tweets stored before it was computed at ingest.
+    Walks tweets once in (created_at, id) order, so each batch starts where
+    the previous one stopped instead of rescanning updated rows.
+    """
+    updated = 0
+    last_key = None
+    try:
+        with session_scope() as db:
+            while True:
+                query = db.query(Tweet.id, Tweet.created_at, Tweet.text).filter(
+                    Tweet.clean_text.is_(None)
+                )
+                if last_key:
+                    query = query.filter(tuple_(Tweet.created_at, Tweet.id) > last_key)
+                rows = query.order_by(Tweet.created_at, Tweet.id).limit(batch_size).all()
+                if not rows:
+                    break
+                last_key = (rows[-1].created_at, rows[-1].id)
+                clean_texts = clean_tweet_texts(row.text for row in rows)
+                db.bulk_update_mappings(
+                    Tweet,
+                    [
+                        {"id": row.id, "created_at": row.created_at, "clean_text": clean_text}
+                        for row, clean_text in zip(rows, clean_texts)
+                    ],
+                )
+                db.commit()
+                updated += len(rows)
+                logger.info(f"Backfilled clean_text for {updated} tweets")
+        return updated
+    except Exception as e:
+        logger.error(f"Error backfilling clean_text: {str(e)}")
+        return updated
+
+
+if __name__ == "__main__":
+    setup_logger()
+    command = sys.argv[1] if len(sys.argv) > 1 else None
+    if command == "partitions":
+        maintain_tweet_partitions(archive="--archive" in sys.argv[2:])
+    elif command == "clean-text":
+        backfill_clean_text()
+    else:
+        print(__doc__.strip())
+        sys.exit(1)
@@ -1,10 +1,16 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text
+from sqlalchemy import Column, Integer, String, DateTime, Float, Text, Index, UniqueConstraint
 from app.models.base import Base
 from datetime import datetime, timezone
 
 
 class Event(Base):
     __tablename__ = "events"
+    __table_args__ = (
+        # Calendar sync upserts on this key
+        UniqueConstraint("title", "start", name="uq_events_title_start"),
+        # Calendar queries filter by type and date window
+        Index("ix_events_event_type_start", "event_type", "start"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     title = Column(String, nullable=False)
@@ -18,6 +24,10 @@ class Event(Base):
         onupdate=datetime.now(timezone.utc),
     )
     event_type = Column(String, default="manual")  # 'manual' or other types
+    content_hash = Column(String(64))  # Hash of synced fields, to skip unchanged events
+    # Parsed from vesting events by the calendar sync
+    token_symbol = Column(String(32))
+    amount_usd = Column(Float)
 
     def __repr__(self):
         return f"<Event(id={self.id}, title='{self.title}', start={self.start})>"
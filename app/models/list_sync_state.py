@@ -0,0 +1,15 @@
+from sqlalchemy import Column, BigInteger, String, DateTime
+from app.models.base import Base
+
+
+class ListSyncState(Base):
+    __tablename__ = "list_sync_state"
+
+    list_id = Column(BigInteger, primary_key=True, autoincrement=False)
+    high_water_id = Column(BigInteger)  # Newest tweet_id of the last completed sync
+    pending_high_water_id = Column(BigInteger)  # Newest tweet_id of the sync in progress
+    next_token = Column(String)  # Pagination cursor to resume an interrupted sync
+    updated_at = Column(DateTime)
+
+    def __repr__(self):
+        return f"<ListSyncState(list_id={self.list_id}, high_water_id={self.high_water_id})>"
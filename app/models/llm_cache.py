@@ -0,0 +1,16 @@
+from sqlalchemy import Column, Integer, String, DateTime, Text
+from app.models.base import Base
+
+
+class LLMCacheEntry(Base):
+    __tablename__ = "llm_cache"
+
+    cache_key = Column(String(64), primary_key=True)  # sha256 of model, params and prompt
+    model = Column(String, nullable=False)
+    response_text = Column(Text, nullable=False)
+    created_at = Column(DateTime, nullable=False)
+    last_used_at = Column(DateTime, nullable=False, index=True)  # For LRU eviction
+    hit_count = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<LLMCacheEntry(cache_key={self.cache_key}, model='{self.model}')>"
@@ -1,11 +1,17 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, Text, Index
 from app.models.base import Base
 
 
 class Summary(Base):
     __tablename__ = "summaries"
+    __table_args__ = (
+        # Keyset pagination of the summaries API
+        Index("ix_summaries_date_summarized_id", "date_summarized", "id"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     summary_text = Column(Text, nullable=False)
     created_at = Column(DateTime, nullable=False)
     date_summarized = Column(DateTime, nullable=False)  # The date the tweets were from
+    last_tweet_id = Column(BigInteger)  # Newest tweet included
+    updated_at = Column(DateTime)
@@ -1,18 +1,34 @@
-from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, Index
 from app.models.base import Base
 
 
 class Tweet(Base):
     __tablename__ = "tweets"
+    __table_args__ = (
+        # Unique keys on a partitioned table must include the partition key.
+        # A snowflake tweet_id fixes its created_at, so this is unique per tweet_id.
+        Index("ix_tweets_tweet_id", "tweet_id", "created_at", unique=True),
+        # Latest/recent tweets per list
+        Index("ix_tweets_list_id_tweet_id", "list_id", "tweet_id"),
+        # Keyset pagination of the tweets API
+        Index("ix_tweets_created_at_id", "created_at", "id"),
+        # Monthly partitions, managed by app.services.tweet_partitions
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    tweet_id = Column(String, unique=True, nullable=False, index=True)
+    tweet_id = Column(BigInteger, nullable=False)
     text = Column(String)
-    created_at = Column(DateTime)
-    author_id = Column(String)
-    list_id = Column(String)
+    # Normalised text for prompts, see app.utils.text
+    clean_text = Column(String)
+    created_at = Column(DateTime, primary_key=True, index=True)
+    author_id = Column(BigInteger)
+    list_id = Column(BigInteger)
     author_username = Column(String)
     author_name = Column(String)
+    # Summary this tweet was folded into, so refreshes pick up every tweet
+    # not yet summarised, whatever order concurrent ingests commit in
+    summary_id = Column(Integer)
 
     def __repr__(self):
         return f"<Tweet(id={self.id}, tweet_id={self.tweet_id}, author_id={self.author_id})>"
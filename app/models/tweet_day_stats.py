@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Integer, BigInteger, Boolean, Date, DateTime
+from app.models.base import Base
+
+
+class TweetDayStats(Base):
+    """Per day and list tweet counts, kept up to date at ingest"""
+
+    __tablename__ = "tweet_day_stats"
+
+    day = Column(Date, primary_key=True)
+    list_id = Column(BigInteger, primary_key=True, autoincrement=False)  # 0 when unknown
+    tweet_count = Column(Integer, nullable=False, default=0)
+    min_tweet_id = Column(BigInteger)
+    max_tweet_id = Column(BigInteger)
+    summarised = Column(Boolean, nullable=False, default=False)
+    updated_at = Column(DateTime)
+
+    def __repr__(self):
+        return f"<TweetDayStats(day={self.day}, list_id={self.list_id}, tweet_count={self.tweet_count})>"
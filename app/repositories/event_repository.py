@@ -1,10 +1,16 @@
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from app.models.event import Event
-from datetime import datetime
-from typing import List, Optional
+from datetime import datetime, timezone
+from typing import Iterable, List, Optional
+import hashlib
+import json
 import logging
-from sqlalchemy import or_
+from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.dialects.postgresql import insert
+
+from app.utils.text import parse_unlock_symbol, parse_usd_amount
 
 logger = logging.getLogger(__name__)
 
@@ -38,17 +44,46 @@ def get_event_by_id(db: Session, event_id: int) -> Optional[Event]:
     return db.query(Event).filter(Event.id == event_id).first()
 
 
-def get_all_events(db: Session) -> List[Event]:
-    vesting_event_to_filter = ["Celestia", "Sei", "Sui"]
+def _event_filters(
+    event_type: str = None,
+    tokens: Iterable[str] = None,
+    min_amount_usd: float = None,
+    start: datetime = None,
+    end: datetime = None,
+    hidden_tokens: Iterable[str] = None,
+) -> list:
+    """
+    Conditions on indexed or parsed columns for get_all_events.
+    tokens and min_amount_usd only match vesting events, which carry them;
+    vesting events of hidden_tokens are left out.
+    """
+    conditions = []
+    if event_type:
+        conditions.append(Event.event_type == event_type)
+    if start:
+        conditions.append(Event.start >= start)
+    if end:
+        conditions.append(Event.start < end)
+    if tokens:
+        conditions.append(Event.token_symbol.in_([token.upper() for token in tokens]))
+    if min_amount_usd is not None:
+        conditions.append(Event.amount_usd >= min_amount_usd)
+    if hidden_tokens:
+        conditions.append(
+            or_(
+                Event.event_type.is_distinct_from("vesting"),
+                Event.token_symbol.is_(None),
+                Event.token_symbol.not_in(list(hidden_tokens)),
+            )
+        )
+    return conditions
 
-    # Create filter conditions for each token
-    token_filters = [
-        Event.description.like(f"%{token}%") for token in vesting_event_to_filter
-    ]
 
+def get_all_events(db: Session, **filters) -> List[Event]:
+    """Events matching the _event_filters keyword arguments, latest first"""
     return (
         db.query(Event)
-        .filter(~((Event.event_type == "vesting") & or_(*token_filters)))
+        .filter(*_event_filters(**filters))
         .order_by(Event.start.desc())
         .all()
     )
@@ -102,3 +137,125 @@ def get_event_by_title_and_date(db: Session, title: str, start_date: datetime) -
     return (
         db.query(Event).filter(Event.title == title, Event.start == start_date).first()
     )
+
+
+def event_content_hash(event_data: dict) -> str:
+    """Hash of the fields a calendar sync can change (title and start are the key)"""
+    content = json.dumps(
+        [event_data.get("description"), event_data["end"], event_data.get("event_type")],
+        default=str,
+    )
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def event_unlock_fields(event_data: dict) -> dict:
+    """Token and USD size of a vesting event, parsed from its title and description"""
+    if event_data.get("event_type") != "vesting":
+        return {"token_symbol": None, "amount_usd": None}
+    return {
+        "token_symbol": parse_unlock_symbol(event_data["title"]),
+        "amount_usd": parse_usd_amount(event_data.get("description")),
+    }
+
+
+def upsert_events(db: Session, events: List[dict], commit=True) -> int:
+    """
+    Insert or update events in one statement, keyed by (title, start).
+    Rows whose content hash is unchanged are left untouched.
+    Args:
+        db: Database session
+        events: List of dicts with title, description, start, end and event_type;
+            token_symbol and amount_usd are parsed from vesting events
+        commit: Commit after the upsert (False to let the caller commit)
+    Returns:
+        Number of events inserted or changed
+    """
+    # One row per key, the last one wins; ON CONFLICT cannot touch a row twice
+    rows = {}
+    for event_data in events:
+        rows[(event_data["title"], event_data["start"])] = {
+            **event_data,
+            **event_unlock_fields(event_data),
+            "content_hash": event_content_hash(event_data),
+        }
+    if not rows:
+        return 0
+
+    now = datetime.now(timezone.utc)
+    stmt = insert(Event).values(
+        [{**row, "created_at": now, "updated_at": now} for row in rows.values()]
+    )
+    stmt = stmt.on_conflict_do_update(
+        constraint="uq_events_title_start",
+        set_={
+            "description": stmt.excluded.description,
+            "end": stmt.excluded.end,
+            "event_type": stmt.excluded.event_type,
+            "token_symbol": stmt.excluded.token_symbol,
+            "amount_usd": stmt.excluded.amount_usd,
+            "content_hash": stmt.excluded.content_hash,
+            "updated_at": stmt.excluded.updated_at,
+        },
+        where=Event.content_hash.is_distinct_from(stmt.excluded.content_hash),
+    ).returning(Event.id)
+
+    changed = len(db.execute(stmt).fetchall())
+    if commit:
+        db.commit()
+    return changed
+
+
+async def create_event_async(
+    db: AsyncSession,
+    title: str,
+    description: str,
+    start: datetime,
+    end: datetime,
+    event_type: str = "manual",
+) -> Event:
+    try:
+        event = Event(
+            title=title,
+            description=description,
+            start=start,
+            end=end,
+            event_type=event_type,
+        )
+        db.add(event)
+        await db.commit()
+        await db.refresh(event)
+        return event
+    except IntegrityError:
+        await db.rollback()
+        raise
+
+
+async def get_event_by_id_async(db: AsyncSession, event_id: int) -> Optional[Event]:
+    return await db.get(Event, event_id)
+
+
+async def get_all_events_async(db: AsyncSession, **filters) -> List[Event]:
+    """Events matching the _event_filters keyword arguments, latest first"""
+    result = await db.execute(
+        select(Event).where(*_event_filters(**filters)).order_by(Event.start.desc())
+    )
+    return result.scalars().all()
+
+
+async def update_event_async(db: AsyncSession, event_id: int, **kwargs) -> Optional[Event]:
+    event = await get_event_by_id_async(db, event_id)
+    if event:
+        for key, value in kwargs.items():
+            setattr(event, key, value)
+        await db.commit()
+        await db.refresh(event)
+    return event
+
+
+async def delete_event_async(db: AsyncSession, event_id: int) -> bool:
+    event = await get_event_by_id_async(db, event_id)
+    if event:
+        await db.delete(event)
+        await db.commit()
+        return True
+    return False
@@ -0,0 +1,47 @@
+from datetime import datetime, timezone
+import logging
+from typing import Optional
+from app.models.list_sync_state import ListSyncState
+
+logger = logging.getLogger(__name__)
+
+
+def get_sync_state(db, list_id) -> Optional[ListSyncState]:
+    return db.query(ListSyncState).filter(ListSyncState.list_id == int(list_id)).first()
+
+
+def checkpoint_sync_state(
+    db, list_id, next_token: str = None, pending_high_water_id: int = None
+) -> ListSyncState:
+    """
+    Record the pagination cursor of an in-progress sync.
+    Not committed here, the caller commits it together with the page's tweets.
+    """
+    state = get_sync_state(db, list_id)
+    if not state:
+        state = ListSyncState(list_id=int(list_id))
+        db.add(state)
+    state.next_token = next_token
+    state.pending_high_water_id = pending_high_water_id
+    state.updated_at = datetime.now(timezone.utc)
+    db.flush()
+    return state
+
+
+def complete_sync_state(db, list_id) -> Optional[ListSyncState]:
+    """Promote the pending high-water mark and clear the cursor"""
+    try:
+        state = get_sync_state(db, list_id)
+        if not state:
+            return None
+        if state.pending_high_water_id:
+            state.high_water_id = state.pending_high_water_id
+        state.pending_high_water_id = None
+        state.next_token = None
+        state.updated_at = datetime.now(timezone.utc)
+        db.commit()
+        return state
+    except Exception as e:
+        logger.error(f"Error completing sync state for list {list_id}: {str(e)}")
+        db.rollback()
+        return None
@@ -0,0 +1,65 @@
+from datetime import datetime
+import logging
+from typing import Optional
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert
+from app.models.llm_cache import LLMCacheEntry
+
+logger = logging.getLogger(__name__)
+
+EVICT_LRU_SQL = text(
+    """
+    DELETE FROM llm_cache WHERE cache_key IN (
+        SELECT cache_key FROM llm_cache ORDER BY last_used_at DESC OFFSET :max_entries
+    )
+    """
+)
+
+
+def get_cache_entry(db, cache_key: str, min_created_at: datetime) -> Optional[LLMCacheEntry]:
+    """Get a cache entry newer than min_created_at and mark it as used"""
+    entry = (
+        db.query(LLMCacheEntry)
+        .filter(LLMCacheEntry.cache_key == cache_key)
+        .filter(LLMCacheEntry.created_at >= min_created_at)
+        .first()
+    )
+    if entry:
+        entry.last_used_at = datetime.utcnow()
+        entry.hit_count += 1
+        db.commit()
+    return entry
+
+
+def save_cache_entry(db, cache_key: str, model: str, response_text: str):
+    now = datetime.utcnow()
+    stmt = insert(LLMCacheEntry).values(
+        cache_key=cache_key,
+        model=model,
+        response_text=response_text,
+        created_at=now,
+        last_used_at=now,
+        hit_count=0,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["cache_key"],
+        set_={
+            "response_text": stmt.excluded.response_text,
+            "created_at": now,
+            "last_used_at": now,
+        },
+    )
+    db.execute(stmt)
+    db.commit()
+
+
+def evict_cache_entries(db, min_created_at: datetime, max_entries: int) -> int:
+    """Delete expired entries and the least recently used beyond max_entries"""
+    expired = (
+        db.query(LLMCacheEntry)
+        .filter(LLMCacheEntry.created_at < min_created_at)
+        .delete(synchronize_session=False)
+    )
+    evicted = db.execute(EVICT_LRU_SQL, {"max_entries": max_entries}).rowcount
+    db.commit()
+    return expired + evicted
@@ -1,18 +1,34 @@
 from datetime import datetime, timezone
 import logging
+from typing import List
+from sqlalchemy import select, tuple_
 from app.models.summary import Summary
+from app.repositories.tweet_day_stats_repository import mark_day_summarised
+from app.repositories.tweet_repository import mark_tweets_summarised
 
 logger = logging.getLogger(__name__)
 
 
-def save_summary(db, summary_text: str, date_summarized: datetime):
+def save_summary(
+    db,
+    summary_text: str,
+    date_summarized: datetime,
+    last_tweet_id: int = None,
+    tweets: List = None,
+):
+    """Save a new summary and mark the tweets it covers"""
     try:
         summary = Summary(
             summary_text=summary_text,
             created_at=datetime.now(timezone.utc),
             date_summarized=date_summarized,
+            last_tweet_id=last_tweet_id,
         )
         db.add(summary)
+        if tweets:
+            db.flush()
+            mark_tweets_summarised(db, summary.id, tweets)
+        mark_day_summarised(db, date_summarized.date())
         db.commit()
         return summary
     except Exception as e:
@@ -21,6 +37,67 @@ def save_summary(db, summary_text: str, date_summarized: datetime):
         return None
 
 
+def update_summary(
+    db, summary: Summary, summary_text: str, last_tweet_id: int, tweets: List = None
+):
+    """Replace a summary's text and mark the tweets folded into it"""
+    try:
+        summary.summary_text = summary_text
+        summary.last_tweet_id = last_tweet_id
+        if tweets:
+            mark_tweets_summarised(db, summary.id, tweets)
+        summary.updated_at = datetime.now(timezone.utc)
+        db.commit()
+        return summary
+    except Exception as e:
+        logger.error(f"Error updating summary: {str(e)}")
+        db.rollback()
+        return None
+
+
 def get_summary_by_date(db, date: datetime):
     """Get summary for a specific date"""
     return db.query(Summary).filter(Summary.date_summarized == date).first()
+
+
+def get_summaries_since(db, start_date: datetime):
+    """Get summaries from start_date on, most recent first"""
+    return (
+        db.query(Summary)
+        .filter(Summary.date_summarized >= start_date)
+        .order_by(Summary.date_summarized.desc())
+        .all()
+    )
+
+
+async def get_summaries_since_async(db, start_date: datetime):
+    """Async version of get_summaries_since"""
+    result = await db.execute(
+        select(Summary)
+        .where(Summary.date_summarized >= start_date)
+        .order_by(Summary.date_summarized.desc())
+    )
+    return result.scalars().all()
+
+
+async def get_summaries_page_async(
+    db, start_date: datetime, limit: int, columns: List[str], before: tuple = None
+) -> List[dict]:
+    """
+    One page of summaries from start_date on, most recent first.
+    Keyset pagination on (date_summarized, id); only the given columns are selected.
+    """
+    stmt = select(*(getattr(Summary, column) for column in columns)).where(
+        Summary.date_summarized >= start_date
+    )
+    if before:
+        stmt = stmt.where(tuple_(Summary.date_summarized, Summary.id) < tuple_(*before))
+    stmt = stmt.order_by(Summary.date_summarized.desc(), Summary.id.desc()).limit(limit)
+    result = await db.execute(stmt)
+    return [dict(row) for row in result.mappings()]
+
+
+async def get_summary_by_date_async(db, date: datetime):
+    """Async version of get_summary_by_date"""
+    result = await db.execute(select(Summary).where(Summary.date_summarized == date))
+    return result.scalars().first()
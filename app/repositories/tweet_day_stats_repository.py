@@ -0,0 +1,120 @@
+from datetime import date, datetime, timezone
+import logging
+from typing import Iterable
+from sqlalchemy import func, desc, select
+from sqlalchemy.dialects.postgresql import insert
+from app.models.tweet_day_stats import TweetDayStats
+
+logger = logging.getLogger(__name__)
+
+# Merges one batch of newly inserted tweets into the rollup; shared with
+# the bulk import, which aggregates its staging table in SQL
+ROLLUP_UPSERT_SQL = """
+INSERT INTO tweet_day_stats AS stats
+    (day, list_id, tweet_count, min_tweet_id, max_tweet_id, summarised, updated_at)
+SELECT created_at::date, COALESCE(list_id, 0), count(*), min(tweet_id), max(tweet_id),
+       false, now() AT TIME ZONE 'utc'
+FROM {source}
+GROUP BY 1, 2
+ON CONFLICT (day, list_id) DO UPDATE SET
+    tweet_count = stats.tweet_count + EXCLUDED.tweet_count,
+    min_tweet_id = LEAST(stats.min_tweet_id, EXCLUDED.min_tweet_id),
+    max_tweet_id = GREATEST(stats.max_tweet_id, EXCLUDED.max_tweet_id),
+    updated_at = EXCLUDED.updated_at
+"""
+
+
+def record_tweet_days(db, tweets: Iterable) -> int:
+    """
+    Add newly inserted tweets to the day rollup, in the caller's transaction.
+    Args:
+        db: Database session
+        tweets: Rows with created_at, list_id and tweet_id (e.g. INSERT ... RETURNING)
+    Returns:
+        Number of (day, list_id) rows touched
+    """
+    days = {}
+    for tweet in tweets:
+        key = (tweet.created_at.date(), tweet.list_id or 0)
+        count, min_id, max_id = days.get(key, (0, tweet.tweet_id, tweet.tweet_id))
+        days[key] = (count + 1, min(min_id, tweet.tweet_id), max(max_id, tweet.tweet_id))
+    if not days:
+        return 0
+
+    now = datetime.now(timezone.utc)
+    stmt = insert(TweetDayStats).values(
+        [
+            {
+                "day": day,
+                "list_id": list_id,
+                "tweet_count": count,
+                "min_tweet_id": min_id,
+                "max_tweet_id": max_id,
+                "summarised": False,
+                "updated_at": now,
+            }
+            for (day, list_id), (count, min_id, max_id) in days.items()
+        ]
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["day", "list_id"],
+        set_={
+            "tweet_count": TweetDayStats.tweet_count + stmt.excluded.tweet_count,
+            "min_tweet_id": func.least(TweetDayStats.min_tweet_id, stmt.excluded.min_tweet_id),
+            "max_tweet_id": func.greatest(TweetDayStats.max_tweet_id, stmt.excluded.max_tweet_id),
+            "updated_at": stmt.excluded.updated_at,
+        },
+    )
+    db.execute(stmt)
+    return len(days)
+
+
+def mark_day_summarised(db, day: date):
+    """Flag all lists of a day as summarised, in the caller's transaction"""
+    db.query(TweetDayStats).filter(TweetDayStats.day == day).update(
+        {"summarised": True}, synchronize_session=False
+    )
+
+
+def get_unsummarised_days(db):
+    """Days that have tweets but no summary, most recent first"""
+    return (
+        db.query(TweetDayStats.day.label("date"))
+        .group_by(TweetDayStats.day)
+        # A list first seen after the day was summarised does not unmark it
+        .having(~func.bool_or(TweetDayStats.summarised))
+        .order_by(desc("date"))
+        .all()
+    )
+
+
+def get_day_counts(db, start_date: date, end_date: date):
+    """Tweet counts per day between two dates, summed over lists"""
+    return (
+        db.query(
+            TweetDayStats.day.label("date"),
+            func.sum(TweetDayStats.tweet_count).label("tweet_count"),
+            func.bool_or(TweetDayStats.summarised).label("summarised"),
+        )
+        .filter(TweetDayStats.day >= start_date)
+        .filter(TweetDayStats.day < end_date)
+        .group_by(TweetDayStats.day)
+        .order_by(desc("date"))
+        .all()
+    )
+
+
+async def get_day_counts_async(db, start_date: date, end_date: date):
+    """Async version of get_day_counts"""
+    result = await db.execute(
+        select(
+            TweetDayStats.day.label("date"),
+            func.sum(TweetDayStats.tweet_count).label("tweet_count"),
+            func.bool_or(TweetDayStats.summarised).label("summarised"),
+        )
+        .where(TweetDayStats.day >= start_date)
+        .where(TweetDayStats.day < end_date)
+        .group_by(TweetDayStats.day)
+        .order_by(desc("date"))
+    )
+    return result.all()
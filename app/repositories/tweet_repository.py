@@ -1,8 +1,13 @@
 from app.models.tweet import Tweet
 import logging
 from datetime import datetime
-from sqlalchemy import distinct, func, desc
-from app.models.summary import Summary
+from typing import List
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from app.repositories.tweet_day_stats_repository import (
+    record_tweet_days,
+    get_unsummarised_days,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -11,37 +16,68 @@ def get_tweets(db, limit: int = 500):
     return db.query(Tweet).order_by(Tweet.tweet_id.desc()).limit(limit).all()
 
 
-def get_tweet_by_twitter_id(db, tweet_id: str):
-    return db.query(Tweet).filter(Tweet.tweet_id == tweet_id).first()
+def bulk_upsert_tweets(db, tweets: List[dict], chunk_size: int = 1000, commit=True) -> int:
+    """
+    Insert tweets in chunks, skipping tweet_ids that are already stored.
+    Uses INSERT ... ON CONFLICT (tweet_id, created_at) DO NOTHING, so
+    overlapping fetches never roll back a whole batch.
+    Inserted rows are added to the tweet_day_stats rollup in the same
+    transaction.
+    Args:
+        db: Database session
+        tweets: List of dicts keyed by Tweet column names
+        chunk_size: Rows per INSERT statement
+        commit: Commit after the last chunk (False to let the caller commit)
+    Returns:
+        Number of rows actually inserted
+    """
+    inserted = 0
+    for i in range(0, len(tweets), chunk_size):
+        stmt = (
+            insert(Tweet)
+            .values(tweets[i : i + chunk_size])
+            .on_conflict_do_nothing(index_elements=["tweet_id", "created_at"])
+            .returning(Tweet.tweet_id, Tweet.created_at, Tweet.list_id)
+        )
+        rows = db.execute(stmt).fetchall()
+        record_tweet_days(db, rows)
+        inserted += len(rows)
+
+    if commit:
+        db.commit()
+    return inserted
+
 
+def get_tweet_by_twitter_id(db, tweet_id):
+    return db.query(Tweet).filter(Tweet.tweet_id == int(tweet_id)).first()
 
-def get_tweets_by_list(db, list_id: str):
-    return db.query(Tweet).filter(Tweet.list_id == list_id).all()
+
+def get_tweets_by_list(db, list_id):
+    return db.query(Tweet).filter(Tweet.list_id == int(list_id)).all()
 
 
 def get_tweet_by_id(db, id: int):
-    return db.query(Tweet).get(id)
+    return db.query(Tweet).filter(Tweet.id == id).first()
 
 
-def get_latest_tweet_id_by_list(db, list_id) -> str:
+def get_latest_tweet_id_by_list(db, list_id) -> int:
     """
     Get the most recent tweet_id for a specific list.
+    Answered from the (list_id, tweet_id) index alone.
     """
     try:
-        latest_tweet = (
-            db.query(Tweet)
-            .filter(Tweet.list_id == str(list_id))
-            .order_by(Tweet.tweet_id.desc())
-            .first()
+        return (
+            db.query(func.max(Tweet.tweet_id))
+            .filter(Tweet.list_id == int(list_id))
+            .scalar()
         )
-        return latest_tweet.tweet_id if latest_tweet else None
 
     except Exception as e:
         logger.error(f"Error getting latest tweet_id: {str(e)}")
         return None
 
 
-def get_recent_tweets(db, list_id: str, limit: int = 20):
+def get_recent_tweets(db, list_id, limit: int = 20):
     """
     Get the most recent tweets for a specific list.
     Args:
@@ -54,7 +90,7 @@ def get_recent_tweets(db, list_id: str, limit: int = 20):
     try:
         tweets = (
             db.query(Tweet)
-            .filter(Tweet.list_id == str(list_id))
+            .filter(Tweet.list_id == int(list_id))
             .order_by(Tweet.tweet_id.desc())
             .limit(limit)
             .all()
@@ -66,27 +102,75 @@ def get_recent_tweets(db, list_id: str, limit: int = 20):
         return []
 
 
-def get_tweets_by_date_range(db, start_date: datetime, end_date: datetime):
-    """Get tweets between two dates"""
-    return (
+def get_tweets_by_date_range(
+    db, start_date: datetime, end_date: datetime, unsummarised: bool = False
+):
+    """Get tweets between two dates, optionally only those not in a summary yet"""
+    query = (
         db.query(Tweet)
         .filter(Tweet.created_at >= start_date)
         .filter(Tweet.created_at < end_date)
-        .order_by(Tweet.created_at.desc())
-        .all()
     )
+    if unsummarised:
+        query = query.filter(Tweet.summary_id.is_(None))
+    return query.order_by(Tweet.created_at.desc()).all()
+
+
+def mark_tweets_summarised(db, summary_id: int, tweets: List[Tweet], chunk_size: int = 1000):
+    """Record the summary the tweets were folded into; does not commit"""
+    for i in range(0, len(tweets), chunk_size):
+        chunk = tweets[i : i + chunk_size]
+        db.query(Tweet).filter(
+            # created_at bounds let the planner skip other partitions
+            Tweet.created_at >= min(tweet.created_at for tweet in chunk),
+            Tweet.created_at <= max(tweet.created_at for tweet in chunk),
+            Tweet.id.in_([tweet.id for tweet in chunk]),
+        ).update({Tweet.summary_id: summary_id}, synchronize_session=False)
+
+
+async def get_tweets_by_date_range_async(
+    db, start_date: datetime, end_date: datetime, unsummarised: bool = False
+):
+    """Async version of get_tweets_by_date_range"""
+    stmt = (
+        select(Tweet)
+        .where(Tweet.created_at >= start_date)
+        .where(Tweet.created_at < end_date)
+    )
+    if unsummarised:
+        stmt = stmt.where(Tweet.summary_id.is_(None))
+    result = await db.execute(stmt.order_by(Tweet.created_at.desc()))
+    return result.scalars().all()
+
+
+async def get_tweets_page_async(
+    db,
+    start_date: datetime,
+    end_date: datetime,
+    limit: int,
+    columns: List[str],
+    before: tuple = None,
+) -> List[dict]:
+    """
+    One page of tweets between two dates, newest first.
+    Keyset pagination on (created_at, id): before is the key of the last
+    row of the previous page. Only the given columns are selected.
+    """
+    stmt = (
+        select(*(getattr(Tweet, column) for column in columns))
+        .where(Tweet.created_at >= start_date)
+        .where(Tweet.created_at < end_date)
+    )
+    if before:
+        stmt = stmt.where(tuple_(Tweet.created_at, Tweet.id) < tuple_(*before))
+    stmt = stmt.order_by(Tweet.created_at.desc(), Tweet.id.desc()).limit(limit)
+    result = await db.execute(stmt)
+    return [dict(row) for row in result.mappings()]
 
 
 def get_dates_without_summaries(db):
-    """Get all dates that have tweets but no summaries, ordered by most recent first"""
-    return (
-        db.query(distinct(func.date_trunc("day", Tweet.created_at)).label("date"))
-        .outerjoin(
-            Summary,
-            func.date_trunc("day", Tweet.created_at)
-            == func.date_trunc("day", Summary.date_summarized),
-        )
-        .filter(Summary.id.is_(None))
-        .order_by(desc("date"))
-        .all()
-    )
+    """
+    Get all dates that have tweets but no summaries, ordered by most recent first.
+    Read from the tweet_day_stats rollup rather than scanning tweets.
+    """
+    return get_unsummarised_days(db)
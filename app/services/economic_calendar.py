@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import os
 import requests
@@ -20,7 +21,12 @@ class EconomicCalendar:
         self.config = config
         self.token_unlocks = TokenUnlocksService()
 
-    async def update_calendar(self):
+    async def update_calendar(self) -> bool:
+        """
+        Sync critical events and unlocks into the events table.
+        The session belongs to the caller and is left open.
+        Returns True if the sync succeeded.
+        """
         try:
             # Get backup events (critical dates)
             backup_events = self.get_critical_events()
@@ -33,36 +39,17 @@ class EconomicCalendar:
             # events = backup_events + unlock_events + backup_unlocks
             events = backup_events + backup_unlocks
 
-            # Update database
-            for event_data in events:
-                try:
-                    # Check if event already exists
-                    existing_event = event_repository.get_event_by_title_and_date(
-                        self.db, event_data["title"], event_data["start"]
-                    )
-                    # if exists and not manual then update
-                    if existing_event:
-                        # Update existing event
-                        event_repository.update_event(
-                            self.db, existing_event.id, **event_data
-                        )
-                    else:
-                        # Create new event
-                        event_repository.create_event(self.db, **event_data)
-
-                except Exception as e:
-                    logger.error(
-                        f"Error updating event {event_data['title']}: {str(e)}"
-                    )
-                    continue
-
-            self.db.commit()
+            # Upsert all events in one statement and transaction, off the event loop
+            changed = await asyncio.to_thread(
+                event_repository.upsert_events, self.db, events
+            )
+            logger.info(f"Calendar synced: {changed}/{len(events)} events new or changed")
+            return True
 
         except Exception as e:
             logger.error(f"Error in update_calendar: {str(e)}")
             self.db.rollback()
-        finally:
-            self.db.close()
+            return False
 
     def get_critical_events(self) -> List[Dict[str, Any]]:
         """Get critical events from all regions"""
@@ -94,5 +81,17 @@ class EconomicCalendar:
 
     def get_backup_unlocks(self) -> List[Dict[str, Any]]:
         """Get backup unlocks from all regions"""
-        backup_unlocks = self.config.TOKEN_UNLOCKS
+        backup_unlocks = []
+        for unlock in self.config.TOKEN_UNLOCKS:
+            try:
+                backup_unlocks.append(
+                    {
+                        **unlock,
+                        "start": datetime.strptime(unlock["start"], "%Y-%m-%dT%H:%M:%SZ"),
+                        "end": datetime.strptime(unlock["end"], "%Y-%m-%dT%H:%M:%SZ"),
+                    }
+                )
+            except Exception as e:
+                logger.error(f"Error parsing unlock {unlock.get('title')}: {str(e)}")
+                continue
         return backup_unlocks
@@ -0,0 +1,113 @@
+import csv
+import io
+import json
+import logging
+from datetime import datetime
+from typing import AsyncIterator, List
+
+from sqlalchemy import select
+
+from app.database.session import AsyncSessionLocal
+from app.models.event import Event
+from app.models.summary import Summary
+from app.models.tweet import Tweet
+
+logger = logging.getLogger(__name__)
+
+# Exportable tables: model, date column the range applies to, columns in output order
+EXPORTS = {
+    "tweets": (
+        Tweet,
+        Tweet.created_at,
+        ["id", "tweet_id", "created_at", "list_id", "author_id", "author_username", "author_name", "text"],
+    ),
+    "summaries": (
+        Summary,
+        Summary.date_summarized,
+        ["id", "date_summarized", "created_at", "updated_at", "last_tweet_id", "summary_text"],
+    ),
+    "events": (
+        Event,
+        Event.start,
+        [
+            "id",
+            "title",
+            "description",
+            "start",
+            "end",
+            "event_type",
+            "token_symbol",
+            "amount_usd",
+            "created_at",
+            "updated_at",
+        ],
+    ),
+}
+
+# Snowflake IDs exceed JavaScript's safe integer range, export them as strings
+STRING_ID_COLUMNS = {"tweet_id", "list_id", "author_id", "last_tweet_id"}
+
+
+def _serialise(row: dict) -> dict:
+    return {
+        column: (
+            str(value)
+            if value is not None and column in STRING_ID_COLUMNS
+            else value.isoformat() if isinstance(value, datetime) else value
+        )
+        for column, value in row.items()
+    }
+
+
+async def iter_export_batches(
+    resource: str, start: datetime, end: datetime, batch_size: int
+) -> AsyncIterator[List[dict]]:
+    """
+    Rows of a table with the date column in [start, end), oldest first,
+    in batches of batch_size. Rows are read through a server-side cursor,
+    so memory stays flat however long the range is. Opens its own session,
+    as it is consumed after the request handler has returned.
+    """
+    model, date_column, columns = EXPORTS[resource]
+    stmt = (
+        select(*(getattr(model, column) for column in columns))
+        .where(date_column >= start)
+        .where(date_column < end)
+        .order_by(date_column, model.id)
+        .execution_options(yield_per=batch_size)
+    )
+    exported = 0
+    async with AsyncSessionLocal() as db:
+        result = await db.stream(stmt)
+        async for partition in result.mappings().partitions():
+            yield [_serialise(row) for row in partition]
+            exported += len(partition)
+    logger.info(f"Exported {exported} {resource} from {start:%Y-%m-%d} to {end:%Y-%m-%d}")
+
+
+async def ndjson_chunks(batches: AsyncIterator[List[dict]]) -> AsyncIterator[str]:
+    async for batch in batches:
+        yield "".join(json.dumps(row, ensure_ascii=False) + "\n" for row in batch)
+
+
+async def csv_chunks(
+    batches: AsyncIterator[List[dict]], columns: List[str]
+) -> AsyncIterator[str]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=columns)
+    writer.writeheader()
+    # Header first, so the client gets a byte before the query returns
+    yield buffer.getvalue()
+    async for batch in batches:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(batch)
+        yield buffer.getvalue()
+
+
+def export_stream(resource: str, start: datetime, end: datetime, format: str, batch_size: int):
+    """Chunks of the export in the given format ("ndjson" or "csv")"""
+    batches = iter_export_batches(resource, start, end, batch_size)
+    if format == "csv":
+        return csv_chunks(batches, EXPORTS[resource][2])
+    return ndjson_chunks(batches)
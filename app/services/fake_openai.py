@@ -0,0 +1,39 @@
+import threading
+import time
+from types import SimpleNamespace
+
+
+class FakeOpenAI:
+    """
+    Offline stand-in for openai.OpenAI.
+    Answers chat.completions.create with a canned summary and records every
+    request, so summary pipelines can run without network or API key.
+    """
+
+    def __init__(self, response_text: str = None, delay_seconds: float = 0.0):
+        self.response_text = response_text
+        self.delay_seconds = delay_seconds
+        self.requests = []
+        self._lock = threading.Lock()
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    def _create(self, model: str, messages: list, **kwargs):
+        prompt = "\n".join(message["content"] for message in messages)
+        with self._lock:
+            self.requests.append({"model": model, "messages": messages, **kwargs})
+        if self.delay_seconds:
+            time.sleep(self.delay_seconds)
+
+        content = self.response_text or (
+            f"Fake summary of {len(prompt.splitlines())} prompt lines"
+        )
+        prompt_tokens = len(prompt) // 4
+        completion_tokens = len(content) // 4
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+            usage=SimpleNamespace(
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+                total_tokens=prompt_tokens + completion_tokens,
+            ),
+        )
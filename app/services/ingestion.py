@@ -0,0 +1,87 @@
+import asyncio
+import logging
+import time
+from typing import List
+
+from app.database.session import SessionLocal, session_scope
+from app.services.tweet_service import sync_list_tweets
+
+logger = logging.getLogger(__name__)
+
+
+class IngestionEngine:
+    """
+    Fetch all Twitter lists concurrently.
+    Each list gets its own DB session and request budget, so one
+    ingestion cycle takes as long as the slowest list.
+    """
+
+    def __init__(self, client, config, session_factory=SessionLocal):
+        self.client = client
+        self.config = config
+        self.session_factory = session_factory
+        self._semaphore = None
+
+    async def ingest_list(self, list_id) -> dict:
+        """Fetch and save new tweets for a single list, with timings"""
+        result = {
+            "list_id": list_id,
+            "new_tweets": 0,
+            "requests": 0,
+            "complete": False,
+            "seconds": 0.0,
+            "error": None,
+        }
+
+        async with self._semaphore:
+            started = time.perf_counter()
+            try:
+                # Pages are committed as they are saved, so no connection is
+                # held while waiting between requests
+                with session_scope(self.session_factory) as db:
+                    stats = await sync_list_tweets(
+                        self.client,
+                        db,
+                        list_id,
+                        max_requests=self.config.INGESTION_MAX_REQUESTS_PER_LIST,
+                        page_delay=self.config.INGESTION_PAGE_DELAY_SECONDS,
+                    )
+                result.update(stats)
+            except Exception as e:
+                logger.error(f"Error ingesting list {list_id}: {str(e)}")
+                result["error"] = str(e)
+            result["seconds"] = round(time.perf_counter() - started, 2)
+
+        logger.info(
+            f"List {list_id}: {result['new_tweets']} new tweets, "
+            f"{result['requests']} requests in {result['seconds']}s"
+            + ("" if result["complete"] else " (will resume next cycle)")
+        )
+        return result
+
+    async def run_cycle(self, list_ids: List = None) -> List[dict]:
+        """Ingest all lists concurrently and return per-list results"""
+        list_ids = list_ids if list_ids is not None else self.config.TWITTER_LISTS
+        self._semaphore = asyncio.Semaphore(self.config.INGESTION_MAX_CONCURRENCY)
+
+        started = time.perf_counter()
+        results = await asyncio.gather(
+            *(self.ingest_list(list_id) for list_id in list_ids)
+        )
+        elapsed = round(time.perf_counter() - started, 2)
+
+        total_new = sum(r["new_tweets"] for r in results)
+        slowest = max((r["seconds"] for r in results), default=0.0)
+        logger.info(
+            f"Ingestion cycle: {total_new} new tweets from {len(results)} lists "
+            f"in {elapsed}s (slowest list {slowest}s)"
+        )
+        return results
+
+
+def run_ingestion_cycle(
+    client, config, list_ids: List = None, session_factory=SessionLocal
+) -> List[dict]:
+    """Run one ingestion cycle from synchronous code"""
+    engine = IngestionEngine(client, config, session_factory=session_factory)
+    return asyncio.run(engine.run_cycle(list_ids))
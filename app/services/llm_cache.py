@@ -0,0 +1,82 @@
+from datetime import datetime, timedelta
+import hashlib
+import json
+import logging
+import threading
+from typing import Callable, Optional
+
+from app.cache import get_cache
+from app.database.session import SessionLocal, session_scope
+from app.repositories.llm_cache_repository import (
+    get_cache_entry,
+    save_cache_entry,
+    evict_cache_entries,
+)
+
+logger = logging.getLogger(__name__)
+
+# Process-wide counters, shared by every OpenAIService instance
+_stats = {"hits": 0, "misses": 0}
+_stats_lock = threading.Lock()
+
+
+def llm_cache_stats() -> dict:
+    with _stats_lock:
+        return dict(_stats)
+
+
+class LLMResponseCache:
+    """
+    Content-addressed cache for chat completions, stored in Postgres.
+    Identical model, parameters and prompt return the stored response;
+    entries expire after ttl_seconds and the least recently used are
+    evicted beyond max_entries. The "llm" app.cache namespace sits in
+    front of the table and makes concurrent identical prompts share one call.
+    """
+
+    def __init__(self, ttl_seconds: int, max_entries: int, session_factory=SessionLocal):
+        self.ttl = timedelta(seconds=ttl_seconds)
+        self.max_entries = max_entries
+        self.session_factory = session_factory
+        self.memory = get_cache("llm", default_ttl=ttl_seconds, max_entries=max_entries)
+
+    @staticmethod
+    def make_key(**parts) -> str:
+        payload = json.dumps(parts, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _record(self, name: str):
+        with _stats_lock:
+            _stats[name] += 1
+
+    def get(self, cache_key: str) -> Optional[str]:
+        try:
+            with session_scope(self.session_factory) as db:
+                entry = get_cache_entry(db, cache_key, datetime.utcnow() - self.ttl)
+                self._record("hits" if entry else "misses")
+                return entry.response_text if entry else None
+        except Exception as e:
+            logger.error(f"Error reading LLM cache: {str(e)}")
+            return None
+
+    def set(self, cache_key: str, model: str, response_text: str):
+        try:
+            with session_scope(self.session_factory) as db:
+                save_cache_entry(db, cache_key, model, response_text)
+                evict_cache_entries(db, datetime.utcnow() - self.ttl, self.max_entries)
+        except Exception as e:
+            logger.error(f"Error writing LLM cache: {str(e)}")
+
+    def get_or_set(self, cache_key: str, model: str, compute: Callable[[], str]) -> str:
+        """Cached response for the key, or compute() stored under it"""
+
+        def load():
+            cached = self.get(cache_key)
+            if cached is not None:
+                logger.info(f"LLM cache hit ({llm_cache_stats()})")
+                return cached
+            response_text = compute()
+            self.set(cache_key, model, response_text)
+            return response_text
+
+        return self.memory.get_or_set(cache_key, load)
@@ -1,29 +1,65 @@
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 import logging
-import re
 from typing import List
-from openai import OpenAI
+from openai import OpenAI, RateLimitError
 from app.repositories.tweet_repository import (
     get_tweets_by_date_range,
-    get_dates_without_summaries,
 )
-from app.repositories.summary_repository import save_summary, get_summary_by_date
-import time
+from app.repositories.summary_repository import (
+    save_summary,
+    update_summary,
+    get_summary_by_date,
+)
+from app.services.prompt_packer import PromptPacker
+from app.services.fake_openai import FakeOpenAI
+from app.services.llm_cache import LLMResponseCache
+from app.utils.text import clean_tweet_text
 
 logger = logging.getLogger(__name__)
 
+MAX_RATE_LIMIT_RETRIES = 5
+
+
+def create_openai_client(config, rate_limited: bool = False):
+    """
+    OpenAI client, or the offline fake when OPENAI_FAKE is set.
+    rate_limited turns off the SDK's own 429 retries, so they reach the
+    AdaptiveRateLimiter straight away instead of stacking two backoffs.
+    """
+    if config.OPENAI_FAKE:
+        return FakeOpenAI()
+    if rate_limited:
+        return OpenAI(api_key=config.OPENAI_API_KEY, max_retries=0)
+    return OpenAI(api_key=config.OPENAI_API_KEY)
+
 
 class OpenAIService:  # Renamed from SummaryService
-    def __init__(self, db, config):
+    def __init__(self, db, config, client=None, rate_limiter=None):
         self.db = db
-        self.client = OpenAI(api_key=config.OPENAI_API_KEY)
+        self._injected_client = client  # e.g. a FakeOpenAI, handed on to backfills
+        self.client = client or create_openai_client(
+            config, rate_limited=rate_limiter is not None
+        )
         self.config = config
+        self.rate_limiter = rate_limiter  # Shared AdaptiveRateLimiter for bulk runs
+        self.cache = None
+        if config.LLM_CACHE_ENABLED:
+            self.cache = LLMResponseCache(
+                config.LLM_CACHE_TTL_SECONDS, config.LLM_CACHE_MAX_ENTRIES
+            )
+        prompt_config = config.OPENAI_PROMPT_CONFIG["DAILY_SUMMARY"]
+        self.packer = PromptPacker(
+            prompt_config["model"], prompt_config["prompt_token_budget"]
+        )
 
-    def get_daily_summary(self, date: datetime = None) -> str:
+    def get_daily_summary(self, date: datetime = None, mode: str = None) -> str:
         """
         Summarize tweets for a specific day using OpenAI
         Args:
             date: Date to summarize (defaults to today)
+            mode: "single" for one call over all tweets, "map_reduce" to summarise
+                list chunks concurrently and merge them (defaults to config)
         """
         try:
             # Default to today if no date provided
@@ -43,27 +79,27 @@ class OpenAIService:  # Renamed from SummaryService
             if not tweets:
                 logger.info(f"No tweets found for {target_date}")
                 return None
+            self._end_read_transaction()
 
-            # Format tweets for the prompt
-            tweets_text = self._format_tweets_for_prompt(tweets)
-            # logger.info(f"Formatted tweets for prompt: {tweets_text}")
-
-            # Generate prompt
-            prompt = self._create_prompt(tweets_text)
-
-            # Get summary from OpenAI
             prompt_config = self.config.OPENAI_PROMPT_CONFIG["DAILY_SUMMARY"]
-            response = self.client.chat.completions.create(
-                model=prompt_config["model"],
-                temperature=prompt_config["temperature"],
-                max_tokens=prompt_config["max_tokens"],
-                messages=[{"role": prompt_config["messages_roles"], "content": prompt}],
-            )
+            if (mode or prompt_config["mode"]) == "map_reduce":
+                summary = self._map_reduce_summary(tweets)
+            else:
+                # Format tweets for the prompt
+                tweets_text = self._format_tweets_for_prompt(tweets)
+                # logger.info(f"Formatted tweets for prompt: {tweets_text}")
+
+                # Generate prompt
+                prompt = self._create_prompt(tweets_text)
 
-            summary = response.choices[0].message.content
+                # Get summary from OpenAI
+                summary = self._complete(prompt)
 
-            # Save the summary
-            saved_summary = save_summary(self.db, summary, start_date)
+            # Save the summary and mark its tweets, refreshes fold in the rest
+            last_tweet_id = max(tweet.tweet_id for tweet in tweets)
+            saved_summary = save_summary(
+                self.db, summary, start_date, last_tweet_id, tweets=tweets
+            )
             if saved_summary:
                 logger.info(f"Saved summary for {target_date}")
 
@@ -73,42 +109,207 @@ class OpenAIService:  # Renamed from SummaryService
             logger.error(f"Error generating summary: {str(e)}")
             return None
 
-    def _clean_tweet_text(self, text: str) -> str:
-        """Clean tweet text for the prompt"""
-        # Remove URLs to save tokens (optional)
-        text = re.sub(r"http\S+", "[link]", text)
-        # Remove unnecessary whitespace and newlines
-        text = " ".join(text.split())
-        # Remove all emojis
-        text = re.sub(r"[^\w\s]", "", text)
-        # Remove RT prefix
-        text = re.sub(r"^RT @\w+:", "", text).strip()
-        return text
-
-    def _format_tweets_for_prompt(self, tweets: List) -> str:
-        """Format tweets into a string for the prompt"""
-        # Group tweets by list_id
+    def _end_read_transaction(self):
+        """
+        Return the session's connection to the pool before the LLM calls,
+        which can take minutes. Loaded rows are kept, not expired.
+        """
+        expire_on_commit = self.db.expire_on_commit
+        self.db.expire_on_commit = False
+        try:
+            self.db.commit()
+        finally:
+            self.db.expire_on_commit = expire_on_commit
+
+    def _clean_tweet_text(self, tweet) -> str:
+        """Cleaned tweet text for the prompt, stored at ingest for newer tweets"""
+        if tweet.clean_text is not None:
+            return tweet.clean_text
+        return clean_tweet_text(tweet.text)
+
+    def refresh_daily_summary(self, date: datetime = None) -> str:
+        """
+        Fold tweets that arrived since the last summary into it.
+        Only the previous summary and the new tweets are sent, so refreshing
+        today's summary costs about the same every time.
+        Args:
+            date: Date to refresh (defaults to today)
+        """
+        try:
+            target_date = date or datetime.utcnow().date()
+            start_date = datetime.combine(target_date, datetime.min.time())
+            end_date = start_date + timedelta(days=1)
+
+            existing_summary = get_summary_by_date(self.db, start_date)
+            if not existing_summary:
+                return self.get_daily_summary(date=target_date)
+
+            # Every tweet not marked as summarised, including ones whose insert
+            # committed late (concurrent list ingests, bulk imports)
+            new_tweets = get_tweets_by_date_range(
+                self.db, start_date, end_date, unsummarised=True
+            )
+
+            if not new_tweets:
+                logger.info(f"No new tweets since last summary for {target_date}")
+                return existing_summary.summary_text
+            self._end_read_transaction()
+
+            template = self.config.PROMPTS["INCREMENTAL_SUMMARY_PROMPT"]
+            tweets_text = self._format_tweets_for_prompt(
+                new_tweets,
+                template=template,
+                extra_reserved_tokens=self.packer.count_tokens(
+                    existing_summary.summary_text
+                ),
+            )
+            # replace() rather than format(), the summary text may contain braces
+            prompt = template.replace("{tweets}", tweets_text).replace(
+                "{summary}", existing_summary.summary_text
+            )
+            summary = self._complete(prompt)
+
+            last_tweet_id = max(tweet.tweet_id for tweet in new_tweets)
+            if existing_summary.last_tweet_id:
+                last_tweet_id = max(last_tweet_id, existing_summary.last_tweet_id)
+            if update_summary(
+                self.db, existing_summary, summary, last_tweet_id, tweets=new_tweets
+            ):
+                logger.info(
+                    f"Refreshed summary for {target_date} with {len(new_tweets)} new tweets"
+                )
+
+            return summary
+
+        except Exception as e:
+            logger.error(f"Error refreshing summary: {str(e)}")
+            return None
+
+    def _complete(self, prompt: str, max_tokens: int = None) -> str:
+        """Send a prompt to OpenAI and return the response text"""
+        prompt_config = self.config.OPENAI_PROMPT_CONFIG["DAILY_SUMMARY"]
+        max_tokens = max_tokens or prompt_config["max_tokens"]
+        if not self.cache:
+            return self._request_completion(prompt, max_tokens)
+
+        cache_key = self.cache.make_key(
+            model=prompt_config["model"],
+            temperature=prompt_config["temperature"],
+            max_tokens=max_tokens,
+            role=prompt_config["messages_roles"],
+            prompt=prompt,  # Template rendered with the packed tweets
+        )
+        return self.cache.get_or_set(
+            cache_key,
+            prompt_config["model"],
+            lambda: self._request_completion(prompt, max_tokens),
+        )
+
+    def _request_completion(self, prompt: str, max_tokens: int) -> str:
+        """Call the chat completions API, backing off when rate limited"""
+        prompt_config = self.config.OPENAI_PROMPT_CONFIG["DAILY_SUMMARY"]
+        retries = 0
+        while True:
+            if self.rate_limiter:
+                self.rate_limiter.acquire(self.packer.count_tokens(prompt) + max_tokens)
+            try:
+                response = self.client.chat.completions.create(
+                    model=prompt_config["model"],
+                    temperature=prompt_config["temperature"],
+                    max_tokens=max_tokens,
+                    messages=[{"role": prompt_config["messages_roles"], "content": prompt}],
+                )
+            except RateLimitError as e:
+                retries += 1
+                if not self.rate_limiter or retries > MAX_RATE_LIMIT_RETRIES:
+                    raise
+                retry_after = e.response.headers.get("retry-after")
+                logger.warning(f"Rate limited by OpenAI, retry {retries}/{MAX_RATE_LIMIT_RETRIES}")
+                self.rate_limiter.on_rate_limited(float(retry_after) if retry_after else None)
+                continue
+
+            if self.rate_limiter:
+                self.rate_limiter.on_success()
+            return response.choices[0].message.content
+
+    def _map_reduce_summary(self, tweets: List) -> str:
+        """
+        Summarise each list in fixed-size tweet chunks concurrently,
+        then merge the partial summaries in a final call.
+        """
+        prompt_config = self.config.OPENAI_PROMPT_CONFIG["DAILY_SUMMARY"]
+        chunk_size = prompt_config["map_chunk_size"]
+
+        chunks = []
+        for list_name, list_tweets in self._group_tweets_by_list(tweets).items():
+            for i in range(0, len(list_tweets), chunk_size):
+                chunks.append((list_name, list_tweets[i : i + chunk_size]))
+
+        def summarise_chunk(chunk):
+            list_name, chunk_tweets = chunk
+            template = self.config.PROMPTS["LIST_SUMMARY_PROMPT"]
+            tweets_text = self._format_tweets_for_prompt(chunk_tweets, template=template)
+            prompt = template.format(list_name=list_name, tweets=tweets_text)
+            return list_name, self._complete(prompt, max_tokens=prompt_config["map_max_tokens"])
+
+        with ThreadPoolExecutor(max_workers=prompt_config["map_concurrency"]) as executor:
+            partials = list(executor.map(summarise_chunk, chunks))
+        logger.info(f"Summarised {len(chunks)} tweet chunks, merging...")
+
+        summaries_text = "\n\n".join(
+            f"### {list_name}\n{partial}" for list_name, partial in partials
+        )
+        prompt = self.config.PROMPTS["MERGE_SUMMARY_PROMPT"].format(summaries=summaries_text)
+        return self._complete(prompt)
+
+    def _group_tweets_by_list(self, tweets: List) -> dict:
+        """Group tweets by list name"""
         tweets_by_list = {}
         for tweet in tweets:
-            list_name = self.config.TWITTER_LISTS_INFO.get(str(tweet.list_id), "Other")
+            list_name = self.config.TWITTER_LISTS_INFO.get(tweet.list_id, "Other")
             if list_name not in tweets_by_list:
                 tweets_by_list[list_name] = []
             tweets_by_list[list_name].append(tweet)
+        return tweets_by_list
 
-        # Format tweets by list with optimized format
-        formatted_sections = []
+    def _format_tweets_for_prompt(
+        self, tweets: List, template: str = None, extra_reserved_tokens: int = 0
+    ) -> str:
+        """Format tweets into a string for the prompt"""
+        # Group tweets by list_id
+        tweets_by_list = self._group_tweets_by_list(tweets)
+
+        candidates = []
         for list_name, list_tweets in tweets_by_list.items():
-            formatted_sections.append(f"\n- {list_name} List")
             # Sort by created_at for chronological order
             sorted_tweets = sorted(
                 list_tweets, key=lambda x: x.created_at, reverse=True
             )
 
             for tweet in sorted_tweets:
-                cleaned_text = self._clean_tweet_text(tweet.text)
+                cleaned_text = self._clean_tweet_text(tweet)
                 if not cleaned_text:  # empty text
                     continue
-                formatted_sections.append(f"[@{tweet.author_username}] {cleaned_text}")
+                candidates.append(
+                    {
+                        "section": list_name,
+                        "line": f"[@{tweet.author_username}] {cleaned_text}",
+                        "raw": tweet.text,
+                    }
+                )
+
+        # Dedupe, rank and fit the tweets to the prompt token budget
+        template = template or self.config.PROMPTS["DAILY_SUMMARY_PROMPT"]
+        packed = self.packer.pack(
+            candidates,
+            reserved_tokens=self.packer.count_tokens(template) + extra_reserved_tokens,
+        )
+
+        # Format tweets by list with optimized format
+        formatted_sections = []
+        for list_name, lines in packed.items():
+            formatted_sections.append(f"\n- {list_name} List")
+            formatted_sections.extend(lines)
 
         return "\n".join(formatted_sections)
 
@@ -117,32 +318,20 @@ class OpenAIService:  # Renamed from SummaryService
         prompt = self.config.PROMPTS["DAILY_SUMMARY_PROMPT"]
         return prompt.format(tweets=tweets_text)
 
-    def process_missing_summaries(self, max_days=None, delay_seconds=1):
+    def process_missing_summaries(self, max_days=None):
         """
         Generate summaries for all dates that have tweets but no summaries
         Args:
             max_days: Optional limit on number of days to process, starting from most recent
-            delay_seconds: Delay between API calls to respect rate limits
         """
-        try:
-            dates = get_dates_without_summaries(self.db)
-
-            total_dates = len(dates) if not max_days else min(len(dates), max_days)
+        # Local import, the runner builds OpenAIService instances itself
+        from app.services.summary_backfill import SummaryBackfillRunner
 
-            logger.info(f"Found {total_dates} dates without summaries")
-
-            # Process dates from most recent
-            for i, date_row in enumerate(dates[:max_days] if max_days else dates):
-                date = date_row.date
-                logger.info(f"Processing summaries for {date} ({i+1}/{total_dates})")
-
-                summary = self.get_daily_summary(date=date)
-                if summary:
-                    logger.info(f"Successfully generated summary for {date}")
-                else:
-                    logger.warning(f"Failed to generate summary for {date}")
-
-                time.sleep(delay_seconds)
+        try:
+            # The runner builds its own client without SDK retries for its rate
+            # limiter; only an injected client (e.g. a fake) is passed along
+            runner = SummaryBackfillRunner(self.config, client=self._injected_client)
+            runner.run(max_days=max_days)
             logger.info("Completed processing historical summaries")
 
         except Exception as e:
@@ -150,10 +339,11 @@ class OpenAIService:  # Renamed from SummaryService
 
 
 def process_yesterday_summary(openai_service):
-    yesterday = datetime.now(datetime.UTC).date() - timedelta(days=1)
-    return openai_service.get_daily_summary(date=yesterday)
+    yesterday = datetime.now(timezone.utc).date() - timedelta(days=1)
+    # An intraday summary may exist already; fold in the rest of the day's tweets
+    return openai_service.refresh_daily_summary(date=yesterday)
 
 
 def process_today_summary(openai_service):
-    today = datetime.now(datetime.UTC).date()
-    return openai_service.get_daily_summary(date=today)
+    today = datetime.now(timezone.utc).date()
+    return openai_service.refresh_daily_summary(date=today)
@@ -0,0 +1,131 @@
+import logging
+import re
+from collections import deque
+from typing import Dict, List
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+logger = logging.getLogger(__name__)
+
+# Links, a leading retweet marker and punctuation; figures and cashtags stay
+SIGNATURE_PATTERN = re.compile(r"https?\S+|^rt @\w+:?|[^\w\s$]")
+CASHTAG_PATTERN = re.compile(r"\$[A-Za-z]{2,10}\b")
+NUMBER_PATTERN = re.compile(r"\d+(?:[.,]\d+)?\s*(?:%|[kmb]\b)?", re.IGNORECASE)
+
+
+class PromptPacker:
+    """
+    Fit tweets into a prompt token budget.
+    Near-identical tweets are dropped, the rest are ranked by signal and
+    taken round-robin across lists so every list keeps its share.
+    """
+
+    def __init__(self, model: str, token_budget: int):
+        self.token_budget = token_budget
+        self._encoding = None
+        if tiktoken:
+            try:
+                try:
+                    self._encoding = tiktoken.encoding_for_model(model)
+                except KeyError:
+                    self._encoding = tiktoken.get_encoding("cl100k_base")
+            except Exception as e:
+                # The BPE file is downloaded on first use, which fails offline
+                logger.warning(
+                    f"tiktoken encoding unavailable, estimating tokens from length: {str(e)}"
+                )
+        else:
+            logger.warning("tiktoken not installed, estimating tokens from length")
+
+    def count_tokens(self, text: str) -> int:
+        if self._encoding:
+            return len(self._encoding.encode(text))
+        return max(1, len(text) // 4)  # ~4 characters per token for English
+
+    @staticmethod
+    def signature(text: str) -> str:
+        """
+        Tweet text without links, retweet marker and punctuation, for dedupe:
+        the same headline from any author or retweet matches, other figures don't
+        """
+        return " ".join(SIGNATURE_PATTERN.sub(" ", text.lower()).split())
+
+    @staticmethod
+    def score(raw_text: str) -> float:
+        """Rough signal score: tickers and figures up, retweets and one-liners down"""
+        score = 2.0 * len(CASHTAG_PATTERN.findall(raw_text))
+        score += 0.5 * len(NUMBER_PATTERN.findall(raw_text))
+        score += min(len(raw_text.split()), 40) / 40
+        if raw_text.startswith("RT @"):
+            score -= 1.0
+        return score
+
+    def pack(self, candidates: List[dict], reserved_tokens: int = 0) -> Dict[str, List[str]]:
+        """
+        Select prompt lines per section within the budget.
+        Args:
+            candidates: dicts with "section", "line" (text as it goes in the
+                prompt) and "raw" (original tweet text, used for ranking and dedupe),
+                in display order
+            reserved_tokens: Tokens already used by the prompt template
+        Returns:
+            dict of section -> selected lines, in the original order
+        """
+        remaining = self.token_budget - reserved_tokens
+        seen = set()
+        queues = {}
+        stats = {}
+
+        for position, candidate in enumerate(candidates):
+            section = candidate["section"]
+            section_stats = stats.setdefault(
+                section, {"kept": 0, "kept_tokens": 0, "dropped": 0, "dropped_tokens": 0, "duplicates": 0}
+            )
+            signature = self.signature(candidate["raw"])
+            if signature in seen:
+                section_stats["duplicates"] += 1
+                continue
+            seen.add(signature)
+            queues.setdefault(section, []).append(
+                (self.score(candidate["raw"]), position, candidate["line"])
+            )
+
+        for section, queue in queues.items():
+            queues[section] = deque(sorted(queue, key=lambda item: (-item[0], item[1])))
+
+        selected = {section: [] for section in queues}
+        for section in queues:
+            remaining -= self.count_tokens(f"\n- {section} List\n")
+
+        # Round-robin over sections, best remaining tweet of each per turn
+        while queues:
+            for section in list(queues):
+                _, position, line = queues[section].popleft()
+                cost = self.count_tokens(line) + 1  # newline
+                section_stats = stats[section]
+                if cost <= remaining:
+                    selected[section].append((position, line))
+                    remaining -= cost
+                    section_stats["kept"] += 1
+                    section_stats["kept_tokens"] += cost
+                else:
+                    section_stats["dropped"] += 1
+                    section_stats["dropped_tokens"] += cost
+                if not queues[section]:
+                    del queues[section]
+
+        for section, section_stats in stats.items():
+            logger.info(
+                f"Prompt list {section}: kept {section_stats['kept']} tweets "
+                f"({section_stats['kept_tokens']} tokens), dropped {section_stats['dropped']} "
+                f"({section_stats['dropped_tokens']} tokens), {section_stats['duplicates']} duplicates"
+            )
+
+        return {
+            section: [line for _, line in sorted(lines)]
+            for section, lines in selected.items()
+            if lines
+        }
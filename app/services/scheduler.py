@@ -1,31 +1,179 @@
+from datetime import datetime, timedelta, timezone
+import time
 from app.utils.config import Config
-from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from app.database.session import SessionLocal, session_scope
 from app.services.economic_calendar import EconomicCalendar
+from app.services.ingestion import run_ingestion_cycle
+from app.services.openai_service import OpenAIService, process_yesterday_summary
+from app.services.tweet_partitions import ensure_tweet_partitions
+from app.services.tweet_service import create_twitter_client
 import logging
 import asyncio
 
 logger = logging.getLogger(__name__)
 
+# Outcome of the latest calendar sync, read by the readiness check
+calendar_sync_status = {"last_success": None, "last_error": None}
 
-async def init_scheduler(db, config: Config):
-    try:
-        scheduler = BackgroundScheduler()
+# Per-job run counts and durations, see scheduler_stats()
+job_metrics = {}
+
+
+async def sync_calendar(config: Config, session_factory=SessionLocal) -> bool:
+    """Run one calendar sync with its own session"""
+    with session_scope(session_factory) as db:
         calendar = EconomicCalendar(db, config)
+        synced = await calendar.update_calendar()
+
+    if synced:
+        calendar_sync_status["last_success"] = datetime.now(timezone.utc)
+        logger.info("Calendar update completed")
+    else:
+        calendar_sync_status["last_error"] = datetime.now(timezone.utc)
+    return synced
+
+
+async def ingest_lists(config: Config, session_factory=SessionLocal) -> bool:
+    """Run one ingestion cycle in a worker thread, each list with its own session"""
+    client = create_twitter_client(config)
+    results = await asyncio.to_thread(
+        run_ingestion_cycle, client, config, session_factory=session_factory
+    )
+    return not any(result["error"] for result in results)
+
+
+def _ensure_partitions(config: Config, session_factory) -> bool:
+    with session_scope(session_factory) as db:
+        ensure_tweet_partitions(db, months_ahead=config.TWEET_PARTITION_MONTHS_AHEAD)
+    return True
+
+
+async def ensure_partitions(config: Config, session_factory=SessionLocal) -> bool:
+    """Keep monthly tweet partitions created ahead of ingestion"""
+    return await asyncio.to_thread(_ensure_partitions, config, session_factory)
+
+
+def _summarise_yesterday(config: Config, session_factory) -> bool:
+    with session_scope(session_factory) as db:
+        return process_yesterday_summary(OpenAIService(db, config)) is not None
 
-        # Run immediately on startup
-        await calendar.update_calendar()
-        logger.info("Initial calendar update completed")
 
-        # Schedule updates
-        scheduler.add_job(
-            lambda: asyncio.create_task(calendar.update_calendar()),
-            "interval",
-            hours=24,  # Run every 24 hours
-            next_run_time=None,  # Don't run immediately again
+async def summarise_yesterday(config: Config, session_factory=SessionLocal) -> bool:
+    """Generate yesterday's summary in a worker thread with its own session"""
+    return await asyncio.to_thread(_summarise_yesterday, config, session_factory)
+
+
+async def run_job(name: str, job, config: Config, session_factory=SessionLocal):
+    """Run a job coroutine and record its duration and outcome"""
+    metrics = job_metrics.setdefault(
+        name,
+        {
+            "runs": 0,
+            "failures": 0,
+            "last_started": None,
+            "last_seconds": None,
+            "max_seconds": 0.0,
+            "total_seconds": 0.0,
+            "last_error": None,
+        },
+    )
+    metrics["runs"] += 1
+    metrics["last_started"] = datetime.now(timezone.utc)
+    started = time.perf_counter()
+    try:
+        succeeded = await job(config, session_factory)
+        if not succeeded:
+            metrics["failures"] += 1
+    except Exception as e:
+        logger.error(f"Job {name} failed: {str(e)}")
+        metrics["failures"] += 1
+        metrics["last_error"] = str(e)
+    finally:
+        elapsed = round(time.perf_counter() - started, 3)
+        metrics["last_seconds"] = elapsed
+        metrics["max_seconds"] = max(metrics["max_seconds"], elapsed)
+        metrics["total_seconds"] = round(metrics["total_seconds"] + elapsed, 3)
+        logger.info(f"Job {name} finished in {elapsed}s")
+
+
+def scheduler_stats(scheduler=None) -> dict:
+    """Job metrics, with next run times if the scheduler is given"""
+    stats = {name: dict(metrics) for name, metrics in job_metrics.items()}
+    if scheduler:
+        for job in scheduler.get_jobs():
+            stats.setdefault(job.id, {})["next_run_time"] = job.next_run_time
+    return stats
+
+
+def init_scheduler(config: Config, session_factory=SessionLocal) -> AsyncIOScheduler:
+    """
+    Start the periodic jobs on the running event loop.
+    Each job runs at most once at a time, with missed runs coalesced,
+    and gets fresh sessions on every run.
+    """
+    try:
+        scheduler = AsyncIOScheduler(
+            timezone=timezone.utc,
+            job_defaults={"max_instances": 1, "coalesce": True, "misfire_grace_time": 300},
         )
+        jitter = config.SCHEDULER_JITTER_SECONDS
+
+        async def sync_calendar_or_retry(config: Config, session_factory) -> bool:
+            synced = await sync_calendar(config, session_factory)
+            if not synced:
+                # Retry soon instead of a full refresh period later
+                retry_at = datetime.now(timezone.utc) + timedelta(
+                    minutes=config.CALENDAR_RETRY_MINUTES
+                )
+                scheduler.modify_job("calendar", next_run_time=retry_at)
+                logger.info(f"Calendar sync failed, retrying at {retry_at}")
+            return synced
+
+        if "calendar" in config.SCHEDULER_JOBS:
+            scheduler.add_job(
+                run_job,
+                "interval",
+                args=["calendar", sync_calendar_or_retry, config, session_factory],
+                id="calendar",
+                hours=config.CALENDAR_REFRESH_HOURS,
+                jitter=jitter,
+                # First sync right away, in the background
+                next_run_time=datetime.now(timezone.utc),
+            )
+        if "partitions" in config.SCHEDULER_JOBS:
+            scheduler.add_job(
+                run_job,
+                "interval",
+                args=["partitions", ensure_partitions, config, session_factory],
+                id="partitions",
+                days=1,
+                jitter=jitter,
+                # Before the first ingestion run
+                next_run_time=datetime.now(timezone.utc),
+            )
+        if "ingestion" in config.SCHEDULER_JOBS:
+            scheduler.add_job(
+                run_job,
+                "interval",
+                args=["ingestion", ingest_lists, config, session_factory],
+                id="ingestion",
+                minutes=config.INGESTION_INTERVAL_MINUTES,
+                jitter=jitter,
+            )
+        if "summaries" in config.SCHEDULER_JOBS:
+            scheduler.add_job(
+                run_job,
+                "cron",
+                args=["summaries", summarise_yesterday, config, session_factory],
+                id="summaries",
+                hour=config.SUMMARY_HOUR_UTC,
+                minute=config.SUMMARY_MINUTE_UTC,
+                jitter=jitter,
+            )
 
         scheduler.start()
-        logger.info("Scheduler started successfully")
+        logger.info(f"Scheduler started with jobs: {[job.id for job in scheduler.get_jobs()]}")
         return scheduler
 
     except Exception as e:
@@ -0,0 +1,180 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import json
+import logging
+from pathlib import Path
+import threading
+import time
+
+from rich.progress import (
+    BarColumn,
+    MofNCompleteColumn,
+    Progress,
+    TextColumn,
+    TimeElapsedColumn,
+    TimeRemainingColumn,
+)
+
+from app.database.session import SessionLocal, session_scope
+from app.repositories.tweet_repository import get_dates_without_summaries
+from app.services.openai_service import OpenAIService, create_openai_client
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveRateLimiter:
+    """
+    Thread-safe requests-per-minute / tokens-per-minute limiter.
+    A 429 halves the effective limits and pauses everyone for the
+    retry-after period; each success recovers the limits gradually.
+    """
+
+    WINDOW_SECONDS = 60
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.scale = 1.0  # Fraction of the configured limits in effect
+        self._requests = deque()  # (timestamp, tokens)
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _wait_time(self, now: float, tokens: int) -> float:
+        while self._requests and now - self._requests[0][0] >= self.WINDOW_SECONDS:
+            self._requests.popleft()
+
+        if now < self._paused_until:
+            return self._paused_until - now
+        if not self._requests:
+            return 0.0
+
+        window_end = self._requests[0][0] + self.WINDOW_SECONDS - now
+        if len(self._requests) >= max(1, int(self.requests_per_minute * self.scale)):
+            return window_end
+        used_tokens = sum(t for _, t in self._requests)
+        if used_tokens + tokens > self.tokens_per_minute * self.scale:
+            return window_end
+        return 0.0
+
+    def acquire(self, tokens: int):
+        """Block until a request of this many tokens fits in the limits"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                wait = self._wait_time(now, tokens)
+                if wait <= 0:
+                    self._requests.append((now, tokens))
+                    return
+            time.sleep(wait)
+
+    def on_rate_limited(self, retry_after: float = None):
+        with self._lock:
+            self.scale = max(0.1, self.scale / 2)
+            self._paused_until = time.monotonic() + (retry_after or 10)
+            logger.warning(f"Rate limit hit, running at {self.scale:.0%} of configured limits")
+
+    def on_success(self):
+        with self._lock:
+            self.scale = min(1.0, self.scale + 0.05)
+
+
+class SummaryBackfillRunner:
+    """
+    Generate missing daily summaries concurrently.
+    Each date runs on its own session; finished and failed dates are
+    checkpointed so a restart only picks up what is left.
+    """
+
+    def __init__(self, config, session_factory=SessionLocal, client=None):
+        self.config = config
+        self.session_factory = session_factory
+        self.client = client or create_openai_client(config, rate_limited=True)
+        self.rate_limiter = AdaptiveRateLimiter(
+            config.OPENAI_REQUESTS_PER_MINUTE, config.OPENAI_TOKENS_PER_MINUTE
+        )
+        self.checkpoint_path = Path(config.SUMMARY_BACKFILL_CHECKPOINT)
+
+    def _load_checkpoint(self) -> dict:
+        if not self.checkpoint_path.exists():
+            return {"completed": [], "failed": {}}
+        with open(self.checkpoint_path) as f:
+            return json.load(f)
+
+    def _save_checkpoint(self, checkpoint: dict):
+        tmp_path = self.checkpoint_path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(checkpoint, f, indent=2)
+        tmp_path.replace(self.checkpoint_path)
+
+    def _summarise_date(self, date) -> bool:
+        with session_scope(self.session_factory) as db:
+            service = OpenAIService(
+                db, self.config, client=self.client, rate_limiter=self.rate_limiter
+            )
+            return service.get_daily_summary(date=date) is not None
+
+    def run(self, max_days=None) -> dict:
+        """
+        Summarise dates without summaries, most recent first.
+        Args:
+            max_days: Optional limit on number of days to process
+        Returns:
+            dict with counts of completed and failed dates
+        """
+        with session_scope(self.session_factory) as db:
+            dates = [row.date for row in get_dates_without_summaries(db)]
+
+        checkpoint = self._load_checkpoint()
+        completed = set(checkpoint["completed"])
+        max_attempts = self.config.SUMMARY_BACKFILL_MAX_ATTEMPTS
+        pending = [
+            date
+            for date in dates
+            if date.strftime("%Y-%m-%d") not in completed
+            and checkpoint["failed"].get(date.strftime("%Y-%m-%d"), 0) < max_attempts
+        ]
+        if max_days:
+            pending = pending[:max_days]
+
+        logger.info(
+            f"Found {len(dates)} dates without summaries, processing {len(pending)}"
+        )
+
+        results = {"completed": 0, "failed": 0}
+        columns = (
+            TextColumn("{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            TimeElapsedColumn(),
+            TextColumn("ETA"),
+            TimeRemainingColumn(),
+        )
+        with Progress(*columns) as progress, ThreadPoolExecutor(
+            max_workers=self.config.SUMMARY_BACKFILL_CONCURRENCY
+        ) as executor:
+            task = progress.add_task("Summaries", total=len(pending))
+            futures = {executor.submit(self._summarise_date, date): date for date in pending}
+
+            for future in as_completed(futures):
+                key = futures[future].strftime("%Y-%m-%d")
+                try:
+                    succeeded = future.result()
+                except Exception as e:
+                    logger.error(f"Error summarising {key}: {str(e)}")
+                    succeeded = False
+
+                if succeeded:
+                    checkpoint["completed"].append(key)
+                    checkpoint["failed"].pop(key, None)
+                    results["completed"] += 1
+                else:
+                    checkpoint["failed"][key] = checkpoint["failed"].get(key, 0) + 1
+                    results["failed"] += 1
+                    logger.warning(f"Failed to generate summary for {key}")
+                self._save_checkpoint(checkpoint)
+                progress.advance(task)
+
+        logger.info(
+            f"Backfill done: {results['completed']} summaries, {results['failed']} failed"
+        )
+        return results
@@ -1,96 +1,195 @@
 import aiohttp
+import asyncio
 import logging
+import random
+import time
 from datetime import datetime, timedelta
-import os
-from dotenv import load_dotenv
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
-load_dotenv()
+from app.cache import Cache, get_cache
+from app.utils.config import Config
 
 logger = logging.getLogger(__name__)
 
+# Tokens to check
+TOKENS = [
+    "Aptos",
+    "Sei",
+    "Pyth",
+    "Axelar",
+    "Arbitrum",
+    "Optimism",
+    "Solana",
+    "Celestia",
+    "Eigenlayer",
+    "Chainlink",
+    "Curve",
+    "Aave",
+    "Cheelee",
+    "Avalanche",
+    "Zksync",
+]
+
+# Worth retrying: rate limited or a server-side failure
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Entries outlive the TTL so expired ones can be revalidated or served when stale
+CACHE_RETENTION_SECONDS = 7 * 24 * 3600
+
 
 class TokenUnlocksService:
-    def __init__(self):
-        self.base_url = "https://production-api.mobula.io/api/1"
-        self.api_key = os.getenv("MOBULA_API_KEY")
+    def __init__(
+        self,
+        base_url: str = None,
+        api_key: str = None,
+        tokens: List[str] = None,
+        cache: Cache = None,
+        config=Config,
+    ):
+        self.base_url = base_url or config.MOBULA_BASE_URL
+        self.api_key = api_key or config.MOBULA_API_KEY
+        self.tokens = tokens or TOKENS
+        # Persistent, so restarts (and uvicorn --reload) don't start cold
+        self.cache = cache or get_cache("token_unlocks", persistent=True)
+        self.ttl_seconds = config.TOKEN_UNLOCKS_CACHE_TTL_SECONDS
+        self.concurrency = config.TOKEN_UNLOCKS_CONCURRENCY
+        self.timeout_seconds = config.TOKEN_UNLOCKS_TIMEOUT_SECONDS
+        self.max_retries = config.TOKEN_UNLOCKS_MAX_RETRIES
 
     async def get_token_unlocks(self) -> List[Dict[str, Any]]:
+        """
+        Upcoming unlocks for all tokens.
+        Tokens cached within the TTL are not requested; the rest are fetched
+        concurrently and revalidated with ETag/If-Modified-Since.
+        """
         try:
-            headers = {"Authorization": f"Bearer {self.api_key}"}
+            started = time.perf_counter()
+            metadata = {}
+            stale = {}
+            entries = await asyncio.gather(
+                *(self.cache.aget(token_name.lower()) for token_name in self.tokens)
+            )
+            for token_name, cached in zip(self.tokens, entries):
+                if cached and time.time() - cached["fetched_at"] < self.ttl_seconds:
+                    metadata[token_name] = cached["data"]
+                else:
+                    stale[token_name] = cached
+
+            if stale:
+                semaphore = asyncio.Semaphore(self.concurrency)
+                timeout = aiohttp.ClientTimeout(total=self.timeout_seconds)
+                async with aiohttp.ClientSession(timeout=timeout) as session:
+                    results = await asyncio.gather(
+                        *(
+                            self._fetch_metadata(session, semaphore, token_name, cached)
+                            for token_name, cached in stale.items()
+                        )
+                    )
+                metadata.update(zip(stale, results))
+
+            logger.info(
+                f"Token unlocks refreshed in {time.perf_counter() - started:.2f}s "
+                f"({len(stale)} requested, {len(self.tokens) - len(stale)} cached)"
+            )
+
             formatted_events = []
+            for token_name in self.tokens:
+                if metadata.get(token_name):
+                    formatted_events.extend(
+                        self._format_unlocks(token_name, metadata[token_name])
+                    )
+            return formatted_events
 
-            # List of tokens to check
-            tokens = [
-                "Aptos",
-                "Sei",
-                "Pyth",
-                "Axelar",
-                "Arbitrum",
-                "Optimism",
-                "Solana",
-                "Celestia",
-                "Eigenlayer",
-                "Chainlink",
-                "Curve",
-                "Aave",
-                "Cheelee",
-                "Avalanche",
-                "Zksync",
-            ]
+        except Exception as e:
+            logger.error(f"Error getting token unlocks: {str(e)}")
+            return []
 
-            async with aiohttp.ClientSession() as session:
-                for token_name in tokens:
-                    try:
-                        url = f"{self.base_url}/metadata?asset={token_name}"
-                        async with session.get(url, headers=headers) as response:
-                            if response.status == 200:
-                                data = await response.json()
-                                release_schedule = data.get("data", {}).get(
-                                    "release_schedule", []
-                                )
+    async def _fetch_metadata(
+        self, session, semaphore, token_name: str, cached: Optional[dict]
+    ) -> Optional[dict]:
+        """Fetch one token's metadata, falling back to the cached copy on failure"""
+        url = f"{self.base_url}/metadata?asset={token_name}"
+        headers = {"Authorization": f"Bearer {self.api_key}"}
+        if cached and cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached and cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
 
-                                for unlock in release_schedule:
-                                    unlock_date = datetime.fromtimestamp(
-                                        unlock["unlock_date"] / 1000
-                                    )
-                                    if unlock_date > datetime.now():
-                                        # Format allocation details
-                                        allocation_str = ", ".join(
-                                            [
-                                                f"{k}: {v:,.0f}"
-                                                for k, v in unlock.get(
-                                                    "allocation_details", {}
-                                                ).items()
-                                            ]
-                                        )
+        async with semaphore:
+            for attempt in range(1, self.max_retries + 1):
+                try:
+                    async with session.get(url, headers=headers) as response:
+                        if response.status == 304 and cached:
+                            cached["fetched_at"] = time.time()
+                            await self._write_cache(token_name, cached)
+                            return cached["data"]
+                        if response.status == 200:
+                            data = await response.json()
+                            await self._write_cache(
+                                token_name,
+                                {
+                                    "fetched_at": time.time(),
+                                    "etag": response.headers.get("ETag"),
+                                    "last_modified": response.headers.get("Last-Modified"),
+                                    "data": data,
+                                },
+                            )
+                            return data
+                        if response.status not in RETRY_STATUSES:
+                            logger.error(
+                                f"Failed to fetch {token_name} data: {response.status}"
+                            )
+                            break
+                        logger.warning(
+                            f"Fetching {token_name} returned {response.status} "
+                            f"(attempt {attempt}/{self.max_retries})"
+                        )
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    logger.warning(
+                        f"Error fetching {token_name} (attempt {attempt}/{self.max_retries}): "
+                        f"{str(e) or type(e).__name__}"
+                    )
 
-                                        formatted_events.append(
-                                            {
-                                                "title": f"CRYPTO: {token_name} Unlock",
-                                                "description": f"{allocation_str if allocation_str else 'Amount'}: {unlock['tokens_to_unlock']:,.0f} {token_name}",
-                                                "start": unlock_date.isoformat(),
-                                                "end": (
-                                                    unlock_date + timedelta(hours=1)
-                                                ).isoformat(),
-                                                "event_type": "vesting",
-                                            }
-                                        )
-                            else:
-                                logger.error(
-                                    f"Failed to fetch {token_name} data: {response.status}"
-                                )
+                if attempt < self.max_retries:
+                    # Exponential backoff with full jitter
+                    await asyncio.sleep(random.uniform(0, 2**attempt))
 
-                    except Exception as e:
-                        logger.error(f"Error processing {token_name}: {str(e)}")
-                        continue
+        if cached:
+            logger.info(f"Using stale cached data for {token_name}")
+            return cached["data"]
+        return None
 
-                return formatted_events
+    def _format_unlocks(self, token_name: str, data: dict) -> List[Dict[str, Any]]:
+        formatted_events = []
+        release_schedule = data.get("data", {}).get("release_schedule", [])
+        for unlock in release_schedule:
+            try:
+                unlock_date = datetime.fromtimestamp(unlock["unlock_date"] / 1000)
+                if unlock_date > datetime.now():
+                    # Format allocation details
+                    allocation_str = ", ".join(
+                        [
+                            f"{k}: {v:,.0f}"
+                            for k, v in unlock.get("allocation_details", {}).items()
+                        ]
+                    )
 
-        except Exception as e:
-            logger.error(f"Error getting token unlocks: {str(e)}")
-            return []
+                    formatted_events.append(
+                        {
+                            "title": f"CRYPTO: {token_name} Unlock",
+                            "description": f"{allocation_str if allocation_str else 'Amount'}: {unlock['tokens_to_unlock']:,.0f} {token_name}",
+                            "start": unlock_date,
+                            "end": unlock_date + timedelta(hours=1),
+                            "event_type": "vesting",
+                        }
+                    )
+            except Exception as e:
+                logger.error(f"Error processing {token_name} unlock: {str(e)}")
+                continue
+        return formatted_events
 
+    async def _write_cache(self, token_name: str, entry: dict):
+        await self.cache.aset(token_name.lower(), entry, ttl=CACHE_RETENTION_SECONDS)
 
 arbitrum = [
     {
@@ -0,0 +1,112 @@
+from datetime import date, datetime
+import logging
+from typing import List
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+PARTITIONS_SQL = text(
+    """
+    SELECT child.relname
+    FROM pg_inherits
+    JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+    JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+    WHERE parent.relname = 'tweets'
+    ORDER BY child.relname
+    """
+)
+
+# Days with tweets in a month that have no summary yet, from the day rollup
+UNSUMMARISED_DAYS_SQL = text(
+    """
+    SELECT count(*)
+    FROM (
+        SELECT day FROM tweet_day_stats
+        WHERE day >= :start AND day < :end
+        GROUP BY day
+        HAVING NOT bool_or(summarised)
+    ) days
+    """
+)
+
+
+def _add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"tweets_{month.year:04d}_{month.month:02d}"
+
+
+def partition_month(name: str) -> date:
+    _, year, month = name.rsplit("_", 2)
+    return date(int(year), int(month), 1)
+
+
+def list_tweet_partitions(db) -> List[str]:
+    """Names of the partitions currently attached to tweets"""
+    return [row[0] for row in db.execute(PARTITIONS_SQL)]
+
+
+def ensure_tweet_partitions(db, months_ahead: int = 3, start: datetime = None) -> List[str]:
+    """
+    Create monthly tweet partitions from start (default: this month)
+    up to months_ahead months in the future.
+    Returns names of the partitions created.
+    """
+    first = (start or datetime.utcnow()).date().replace(day=1)
+    last = _add_months(datetime.utcnow().date().replace(day=1), months_ahead)
+    existing = set(list_tweet_partitions(db))
+
+    created = []
+    month = first
+    while month <= last:
+        name = partition_name(month)
+        if name not in existing:
+            db.execute(
+                text(
+                    f"CREATE TABLE {name} PARTITION OF tweets "
+                    f"FOR VALUES FROM ('{month.isoformat()}') "
+                    f"TO ('{_add_months(month, 1).isoformat()}')"
+                )
+            )
+            created.append(name)
+        month = _add_months(month, 1)
+
+    db.commit()
+    if created:
+        logger.info(f"Created tweet partitions: {', '.join(created)}")
+    return created
+
+
+def archive_tweet_partitions(db, older_than_months: int, schema: str) -> List[str]:
+    """
+    Detach partitions older than older_than_months whose days are all
+    summarised, and move them to the archive schema.
+    Returns names of the partitions archived.
+    """
+    cutoff = _add_months(datetime.utcnow().date().replace(day=1), -older_than_months)
+    db.execute(text(f"CREATE SCHEMA IF NOT EXISTS {schema}"))
+
+    archived = []
+    for name in list_tweet_partitions(db):
+        if _add_months(partition_month(name), 1) > cutoff:
+            continue
+
+        month = partition_month(name)
+        unsummarised = db.execute(
+            UNSUMMARISED_DAYS_SQL, {"start": month, "end": _add_months(month, 1)}
+        ).scalar()
+        if unsummarised:
+            logger.info(f"Keeping {name}: {unsummarised} days without summaries")
+            continue
+
+        db.execute(text(f"ALTER TABLE tweets DETACH PARTITION {name}"))
+        db.execute(text(f"ALTER TABLE {name} SET SCHEMA {schema}"))
+        archived.append(name)
+
+    db.commit()
+    if archived:
+        logger.info(f"Archived tweet partitions to {schema}: {', '.join(archived)}")
+    return archived
@@ -1,29 +1,218 @@
 from sqlalchemy.exc import IntegrityError
 from app.models.tweet import Tweet
-from app.repositories.tweet_repository import get_latest_tweet_id_by_list
+from app.repositories.tweet_repository import (
+    get_latest_tweet_id_by_list,
+    bulk_upsert_tweets,
+)
+from app.repositories.tweet_day_stats_repository import record_tweet_days
+from app.services.tweet_partitions import ensure_tweet_partitions
+from app.repositories.list_sync_repository import (
+    get_sync_state,
+    checkpoint_sync_state,
+    complete_sync_state,
+)
+from app.utils.config import Config
+from app.utils.text import clean_tweet_text, clean_tweet_texts
+from datetime import datetime
 from typing import Optional
+import asyncio
 import logging
-import time
+import tweepy
 
 logger = logging.getLogger(__name__)
 
 
+def create_twitter_client(config) -> tweepy.Client:
+    return tweepy.Client(
+        bearer_token=config.BEARER_TOKEN,
+        consumer_key=config.API_KEY,
+        consumer_secret=config.API_SECRET_KEY,
+        access_token=config.ACCESS_TOKEN,
+        access_token_secret=config.ACCESS_TOKEN_SECRET,
+    )
+
+
 def save_tweet(db, tweet_data):
     try:
         tweet = Tweet(
-            tweet_id=str(tweet_data.id),  # Make sure it's a string
+            tweet_id=int(tweet_data.id),
             text=tweet_data.text,
+            clean_text=clean_tweet_text(tweet_data.text),
             created_at=tweet_data.created_at,
-            author_id=str(tweet_data.author_id),
-            list_id=str(tweet_data.list_id),
+            author_id=int(tweet_data.author_id),
+            list_id=int(tweet_data.list_id),
         )
         db.add(tweet)
+        record_tweet_days(db, [tweet])
         db.commit()
         return tweet
     except IntegrityError:
         db.rollback()
         # Tweet already exists
-        return db.query(Tweet).filter(Tweet.tweet_id == str(tweet_data.id)).first()
+        return db.query(Tweet).filter(Tweet.tweet_id == int(tweet_data.id)).first()
+
+
+LIST_TWEET_FIELDS = [
+    "created_at",
+    "public_metrics",
+    "author_id",
+    "text",
+    "conversation_id",
+    "in_reply_to_user_id",
+    "referenced_tweets",
+    "attachments",
+]
+
+
+def request_list_page(client, list_id: str, pagination_token: str = None):
+    """Request a single page of tweets from a list (blocking API call)"""
+    return client.get_list_tweets(
+        id=list_id,
+        pagination_token=pagination_token,
+        max_results=100,  # Maximum allowed by Twitter API
+        tweet_fields=LIST_TWEET_FIELDS,
+        user_fields=["username", "name"],
+        expansions=["author_id", "referenced_tweets.id"],
+    )
+
+
+async def iter_list_pages(
+    client,
+    list_id: str,
+    since_id: str = None,
+    pagination_token: str = None,
+    max_requests: int = None,
+    page_delay: float = 2,
+):
+    """
+    Page through a list without blocking the event loop, newest tweets first.
+    API calls run in a worker thread and pacing uses asyncio.sleep,
+    so several lists can be fetched at the same time.
+    Args:
+        client: Twitter API client
+        list_id: ID of the list to fetch from
+        since_id: High-water mark, paging stops at the first tweet not newer than it
+        pagination_token: Cursor to resume from (None to start from the newest tweet)
+        max_requests: Request budget for this call, retries included (None for no limit)
+        page_delay: Seconds to wait between pages
+    Yields:
+        dict with the page's new tweets, users, next_token, whether the
+        high-water mark was reached and the number of requests made so far
+    """
+    retry_count = 0
+    max_retries = 3
+    wait_time = page_delay
+    requests_made = 0
+
+    while True:
+        if max_requests and requests_made >= max_requests:
+            logger.info(f"Request budget of {max_requests} reached for list {list_id}")
+            return
+
+        try:
+            requests_made += 1
+            response = await asyncio.to_thread(
+                request_list_page, client, list_id, pagination_token
+            )
+        except Exception as e:
+            logger.error(f"Error in request: {str(e)}")
+            retry_count += 1
+            if retry_count > max_retries:
+                logger.error("Max retries exceeded")
+                return
+
+            wait_time *= 2  # Double the wait time for next retry
+            await asyncio.sleep(wait_time)
+            continue
+
+        if not response.data:
+            # End of the list
+            yield {
+                "tweets": [],
+                "users": {},
+                "next_token": None,
+                "reached_high_water": False,
+                "requests": requests_made,
+            }
+            return
+
+        users = {}
+        if response.includes and "users" in response.includes:
+            for user in response.includes["users"]:
+                users[user.id] = user
+
+        # The list endpoint has no since_id, so stop at the first stored tweet
+        tweets = response.data
+        if since_id:
+            tweets = [t for t in response.data if int(t.id) > int(since_id)]
+        reached_high_water = len(tweets) < len(response.data)
+
+        pagination_token = response.meta.get("next_token")
+        logger.info(f"Fetched batch of {len(response.data)} tweets")
+
+        yield {
+            "tweets": tweets,
+            "users": users,
+            "next_token": pagination_token,
+            "reached_high_water": reached_high_water,
+            "requests": requests_made,
+        }
+
+        if reached_high_water or not pagination_token:
+            return
+
+        # Pace requests to avoid rate limits
+        logger.info(f"Waiting {wait_time} seconds before next request...")
+        await asyncio.sleep(wait_time)
+
+
+async def fetch_list_tweets_async(
+    client,
+    list_id: str,
+    since_id: str = None,
+    limit: int = None,
+    max_requests: int = None,
+    page_delay: float = 2,
+) -> dict:
+    """
+    Fetch tweets from a list without blocking the event loop.
+    Args:
+        client: Twitter API client
+        list_id: ID of the list to fetch from
+        since_id: Only return tweets newer than this ID
+        limit: Maximum number of tweets to fetch (None for no limit)
+        max_requests: Request budget for this call, retries included (None for no limit)
+        page_delay: Seconds to wait between pages
+    """
+    all_tweets = []
+    all_users = {}
+    requests_made = 0
+
+    pages = iter_list_pages(
+        client,
+        list_id,
+        since_id=since_id,
+        max_requests=max_requests,
+        page_delay=page_delay,
+    )
+    async for page in pages:
+        all_tweets.extend(page["tweets"])
+        all_users.update(page["users"])
+        requests_made = page["requests"]
+
+        # Break if we've reached the limit
+        if limit and len(all_tweets) >= limit:
+            all_tweets = all_tweets[:limit]  # Trim to exact limit
+            break
+    await pages.aclose()
+
+    logger.info(f"Fetched total of {len(all_tweets)} tweets from list {list_id}")
+
+    return {
+        "tweets": all_tweets,
+        "includes": {"users": all_users},  # to keep twitter api format
+        "requests": requests_made,
+    }
 
 
 def fetch_list_tweets(
@@ -38,131 +227,135 @@ def fetch_list_tweets(
         limit: Maximum number of tweets to fetch (None for no limit)
     """
     try:
-        all_tweets = []
-        all_users = {}
-        last_response = None  # store for the user data
-        pagination_token = None
-        retry_count = 0
-        max_retries = 3
-        wait_time = 2  # Initial wait time in seconds
-
-        while True:
-            try:
-                response = client.get_list_tweets(
-                    id=list_id,
-                    pagination_token=pagination_token,
-                    max_results=100,  # Maximum allowed by Twitter API
-                    tweet_fields=[
-                        "created_at",
-                        "public_metrics",
-                        "author_id",
-                        "text",
-                        "conversation_id",
-                        "in_reply_to_user_id",
-                        "referenced_tweets",
-                        "attachments",
-                    ],
-                    user_fields=["username", "name"],
-                    expansions=["author_id", "referenced_tweets.id"],
-                )
-
-                if not response.data:
-                    break
-
-                # Collect users from this page
-                if response.includes and "users" in response.includes:
-                    for user in response.includes["users"]:
-                        all_users[user.id] = user
-
-                # If since_id is provided, filter tweets in memory
-                if since_id:
-                    new_tweets = [t for t in response.data if int(t.id) > int(since_id)]
-                    if not new_tweets:
-                        # If no new tweets in this batch, we can stop
-                        break
-                    all_tweets.extend(new_tweets)
-                else:
-                    all_tweets.extend(response.data)
-
-                logger.info(f"Fetched batch of {len(response.data)} tweets")
-
-                # Break if we've reached the limit
-                if limit and len(all_tweets) >= limit:
-                    all_tweets = all_tweets[:limit]  # Trim to exact limit
-                    break
-
-                pagination_token = response.meta.get("next_token")
-                if not pagination_token:
-                    break
-
-                # Sleep between requests to avoid rate limits
-                logger.info(f"Waiting {wait_time} seconds before next request...")
-                time.sleep(wait_time)
-
-            except Exception as e:
-                logger.error(f"Error in request: {str(e)}")
-                retry_count += 1
-                if retry_count > max_retries:
-                    logger.error("Max retries exceeded")
-                    break
-
-                wait_time *= 2  # Double the wait time for next retry
-                continue
-
-        logger.info(f"Fetched total of {len(all_tweets)} tweets from list {list_id}")
-
-        return {
-            "tweets": all_tweets,
-            "includes": {"users": all_users},  # to keep twitter api format
-        }
-
+        return asyncio.run(
+            fetch_list_tweets_async(client, list_id, since_id=since_id, limit=limit)
+        )
     except Exception as e:
         logger.error(f"Error fetching tweets for list {list_id}: {str(e)}")
         return []
 
 
-def update_list_tweets(client, db, list_id: str):
+def save_list_tweets(db, list_id: str, response, checkpoint: dict = None) -> int:
     """
-    Update tweets from a list. If DB is empty, fetch initial batch.
+    Save fetched list tweets to the database.
+    If a checkpoint is given, the list's sync state is committed in the
+    same transaction so the cursor never runs ahead of the stored tweets.
     Returns number of new tweets saved.
     """
-    since_id = get_latest_tweet_id_by_list(db, list_id)
-
-    if not since_id:
-        logger.info("No tweets in DB, fetching initial batch...")
-        response = fetch_list_tweets(
-            client, list_id, limit=100
-        )  # Limit to 100 tweets, for initial load
-    else:
-        logger.info(f"Fetching tweets since ID: {since_id}")
-        response = fetch_list_tweets(client, list_id, since_id)
-
-    if not response:
-        return 0
-
     try:
         tweets_data = convert_to_serializable(response)
+        clean_texts = clean_tweet_texts(tweet["text"] for tweet in tweets_data)
 
         new_tweets = [
-            Tweet(
-                tweet_id=str(tweet["id"]),
-                text=tweet["text"],
-                created_at=tweet["created_at"],
-                author_id=tweet["author_id"],
-                author_username=tweet["author_username"],
-                author_name=tweet["author_name"],
-                list_id=str(list_id),
-            )
-            for tweet in tweets_data
+            {
+                "tweet_id": int(tweet["id"]),
+                "text": tweet["text"],
+                "clean_text": clean_text,
+                "created_at": tweet["created_at"],
+                "author_id": int(tweet["author_id"]),
+                "author_username": tweet["author_username"],
+                "author_name": tweet["author_name"],
+                "list_id": int(list_id),
+            }
+            for tweet, clean_text in zip(tweets_data, clean_texts)
         ]
 
-        db.bulk_save_objects(new_tweets)
+        if new_tweets:
+            # A first backfill can reach into months without a partition yet
+            ensure_tweet_partitions(
+                db,
+                months_ahead=Config.TWEET_PARTITION_MONTHS_AHEAD,
+                start=min(datetime.fromisoformat(tweet["created_at"]) for tweet in new_tweets),
+            )
+        saved = bulk_upsert_tweets(
+            db, new_tweets, chunk_size=Config.TWEET_UPSERT_CHUNK_SIZE, commit=False
+        )
+        if checkpoint is not None:
+            checkpoint_sync_state(db, list_id, **checkpoint)
         db.commit()
-        return len(new_tweets)
+        if saved < len(new_tweets):
+            logger.info(f"Skipped {len(new_tweets) - saved} tweets already stored")
+        return saved
 
     except Exception as e:
         logger.error(f"Database error while saving tweets: {str(e)}", exc_info=True)
         db.rollback()
+        raise
+
+
+async def sync_list_tweets(
+    client, db, list_id: str, max_requests: int = None, page_delay: float = 2
+) -> dict:
+    """
+    Fetch and save new tweets for a list, down to the stored high-water mark.
+    Every page is saved together with its pagination cursor, so a sync cut
+    short by the request budget or an error resumes where it stopped.
+    Database work runs in a worker thread so other lists keep making progress.
+    Returns dict with number of new tweets saved, API requests made and
+    whether the list is fully synced.
+    """
+    state = await asyncio.to_thread(get_sync_state, db, list_id)
+    if state:
+        high_water_id = state.high_water_id
+    else:
+        # Lists synced before checkpoints existed start from their newest stored tweet
+        high_water_id = await asyncio.to_thread(get_latest_tweet_id_by_list, db, list_id)
+    resume_token = state.next_token if state else None
+    pending_high_water_id = state.pending_high_water_id if state else None
+
+    if resume_token:
+        logger.info(f"Resuming list {list_id} from saved cursor")
+    elif high_water_id:
+        logger.info(f"Fetching tweets since ID: {high_water_id}")
+    else:
+        logger.info("No tweets in DB, starting backfill...")
+
+    new_tweets = 0
+    requests_made = 0
+    complete = False
+
+    pages = iter_list_pages(
+        client,
+        list_id,
+        since_id=high_water_id,
+        pagination_token=resume_token,
+        max_requests=max_requests,
+        page_delay=page_delay,
+    )
+    async for page in pages:
+        requests_made = page["requests"]
+        if page["tweets"] and not pending_high_water_id:
+            # Newest tweet of this sync becomes the high-water mark once it completes
+            pending_high_water_id = max(int(t.id) for t in page["tweets"])
+
+        checkpoint = {
+            "next_token": page["next_token"],
+            "pending_high_water_id": pending_high_water_id,
+        }
+        new_tweets += await asyncio.to_thread(
+            save_list_tweets,
+            db,
+            list_id,
+            {"tweets": page["tweets"], "includes": {"users": page["users"]}},
+            checkpoint,
+        )
+        complete = page["reached_high_water"] or not page["next_token"]
+
+    if complete:
+        await asyncio.to_thread(complete_sync_state, db, list_id)
+
+    return {"new_tweets": new_tweets, "requests": requests_made, "complete": complete}
+
+
+def update_list_tweets(client, db, list_id: str):
+    """
+    Update tweets from a list. If DB is empty, backfill from the newest tweet.
+    Returns number of new tweets saved.
+    """
+    try:
+        return asyncio.run(sync_list_tweets(client, db, list_id))["new_tweets"]
+    except Exception as e:
+        logger.error(f"Error updating tweets for list {list_id}: {str(e)}")
         return 0
 
 
@@ -2,6 +2,7 @@ import os
 import json
 from dotenv import load_dotenv
 from pathlib import Path
+from sqlalchemy.engine import make_url
 
 load_dotenv()
 
@@ -39,6 +40,33 @@ class Config:
     FRED_API_KEY = os.getenv("FRED_API_KEY")
     FRED_BASE_URL = "https://api.stlouisfed.org/fred/series/observations"
 
+    # Periodic jobs run by the API's scheduler
+    SCHEDULER_JOBS = os.getenv("SCHEDULER_JOBS", "calendar,partitions,ingestion,summaries").split(",")
+    # Random delay added to each run so jobs don't fire in lockstep
+    SCHEDULER_JITTER_SECONDS = int(os.getenv("SCHEDULER_JITTER_SECONDS", 60))
+    CALENDAR_REFRESH_HOURS = int(os.getenv("CALENDAR_REFRESH_HOURS", 24))
+    CALENDAR_RETRY_MINUTES = int(os.getenv("CALENDAR_RETRY_MINUTES", 5))
+    # Yesterday's summary is generated shortly after midnight UTC
+    SUMMARY_HOUR_UTC = int(os.getenv("SUMMARY_HOUR_UTC", 0))
+    SUMMARY_MINUTE_UTC = int(os.getenv("SUMMARY_MINUTE_UTC", 15))
+
+    # Token unlocks (Mobula)
+    MOBULA_API_KEY = os.getenv("MOBULA_API_KEY")
+    MOBULA_BASE_URL = os.getenv("MOBULA_BASE_URL", "https://production-api.mobula.io/api/1")
+    TOKEN_UNLOCKS_CONCURRENCY = int(os.getenv("TOKEN_UNLOCKS_CONCURRENCY", 8))
+    TOKEN_UNLOCKS_TIMEOUT_SECONDS = float(os.getenv("TOKEN_UNLOCKS_TIMEOUT_SECONDS", 10))
+    TOKEN_UNLOCKS_MAX_RETRIES = int(os.getenv("TOKEN_UNLOCKS_MAX_RETRIES", 3))
+    # Vesting events of these tokens are left out of /api/events/
+    HIDDEN_VESTING_TOKENS = [
+        token.strip().upper()
+        for token in os.getenv("HIDDEN_VESTING_TOKENS", "CELESTIA,SEI,SUI").split(",")
+        if token.strip()
+    ]
+    # Responses younger than the TTL are served from the cache without a request
+    TOKEN_UNLOCKS_CACHE_TTL_SECONDS = int(
+        os.getenv("TOKEN_UNLOCKS_CACHE_TTL_SECONDS", 6 * 3600)
+    )
+
     API_KEY = os.getenv("API_KEY")
     API_SECRET_KEY = os.getenv("API_SECRET_KEY")
     ACCESS_TOKEN = os.getenv("ACCESS_TOKEN")
@@ -49,6 +77,39 @@ class Config:
     DATABASE_URL = os.getenv(
         "DATABASE_URL", "postgresql://user:password@db:5432/twitter_db"
     )
+    # Connection pool, per engine (the API's async engine has its own)
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 5))
+    DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 10))
+    # Seconds to wait for a free connection before giving up
+    DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", 30))
+    # Replace connections older than this, before the server or a proxy drops them
+    DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 1800))
+    # Test connections on checkout so broken ones are never handed out
+    DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+    # Applies to the API's async engine only, background jobs run unbounded
+    DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", 30000))
+    # Cached API responses; writes in this process invalidate them right away,
+    # the TTL bounds staleness from writers in other processes (e.g. the CLI)
+    RESPONSE_CACHE_TTL_SECONDS = int(os.getenv("RESPONSE_CACHE_TTL_SECONDS", 60))
+    RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", 256))
+    # app.cache backend: "memory" (per process) or "redis" (shared through REDIS_URL)
+    CACHE_BACKEND = os.getenv("CACHE_BACKEND", "memory").lower()
+    REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+    # Per namespace, for the memory backend
+    CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", 1024))
+    # Persistent namespaces (e.g. token_unlocks) without Redis
+    CACHE_DIR = os.getenv("CACHE_DIR", ".cache")
+    CACHE_DEFAULT_TTL_SECONDS = int(os.getenv("CACHE_DEFAULT_TTL_SECONDS", 300))
+    # Rows fetched per server-side cursor round trip in /api/export
+    EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", 1000))
+    # Same database through asyncpg, for the API's async routes, whatever
+    # driver DATABASE_URL names (e.g. postgresql+psycopg2://)
+    ASYNC_DATABASE_URL = os.getenv(
+        "ASYNC_DATABASE_URL",
+        make_url(DATABASE_URL)
+        .set(drivername="postgresql+asyncpg")
+        .render_as_string(hide_password=False),
+    )
     # Twitter Lists
     TWITTER_LIST_ID_TRADERS = 1877782370352324758
     TWITTER_LIST_ID_AIRDROP = 1877785365790196202
@@ -69,7 +130,39 @@ class Config:
         TWITTER_LIST_ID_STOCKS: "Stocks",
     }
 
+    # Ingestion
+    INGESTION_MAX_CONCURRENCY = int(os.getenv("INGESTION_MAX_CONCURRENCY", 4))
+    # Rate-limit budget: max API requests per list in one ingestion cycle
+    INGESTION_MAX_REQUESTS_PER_LIST = int(
+        os.getenv("INGESTION_MAX_REQUESTS_PER_LIST", 10)
+    )
+    INGESTION_PAGE_DELAY_SECONDS = float(os.getenv("INGESTION_PAGE_DELAY_SECONDS", 2))
+    INGESTION_INTERVAL_MINUTES = int(os.getenv("INGESTION_INTERVAL_MINUTES", 15))
+    # Rows per INSERT ... ON CONFLICT statement when saving tweets
+    TWEET_UPSERT_CHUNK_SIZE = int(os.getenv("TWEET_UPSERT_CHUNK_SIZE", 1000))
+    # Monthly tweet partitions to create ahead of time
+    TWEET_PARTITION_MONTHS_AHEAD = int(os.getenv("TWEET_PARTITION_MONTHS_AHEAD", 3))
+    # Detach fully summarised partitions older than this many months (0 = never)
+    TWEET_ARCHIVE_AFTER_MONTHS = int(os.getenv("TWEET_ARCHIVE_AFTER_MONTHS", 0))
+    TWEET_ARCHIVE_SCHEMA = os.getenv("TWEET_ARCHIVE_SCHEMA", "tweets_archive")
+    # Rows per COPY batch when importing tweet archives
+    BULK_IMPORT_BATCH_SIZE = int(os.getenv("BULK_IMPORT_BATCH_SIZE", 50000))
+
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY")
+    # Account limits for bulk summary generation, lowered automatically on 429s
+    OPENAI_REQUESTS_PER_MINUTE = int(os.getenv("OPENAI_REQUESTS_PER_MINUTE", 500))
+    OPENAI_TOKENS_PER_MINUTE = int(os.getenv("OPENAI_TOKENS_PER_MINUTE", 300000))
+    SUMMARY_BACKFILL_CONCURRENCY = int(os.getenv("SUMMARY_BACKFILL_CONCURRENCY", 4))
+    SUMMARY_BACKFILL_MAX_ATTEMPTS = int(os.getenv("SUMMARY_BACKFILL_MAX_ATTEMPTS", 3))
+    SUMMARY_BACKFILL_CHECKPOINT = os.getenv(
+        "SUMMARY_BACKFILL_CHECKPOINT", "summary_backfill_checkpoint.json"
+    )
+    # Cache completions for identical model, parameters and prompt
+    LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+    LLM_CACHE_TTL_SECONDS = int(os.getenv("LLM_CACHE_TTL_SECONDS", 7 * 24 * 3600))
+    LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", 1000))
+    # Use the offline fake client instead of the OpenAI API
+    OPENAI_FAKE = os.getenv("OPENAI_FAKE", "false").lower() == "true"
 
     # OpenAI Configuration
     OPENAI_PROMPT_CONFIG = {
@@ -78,6 +171,14 @@ class Config:
             "model": "gpt-4-1106-preview",  # gpt-4-turbo-preview is an alias for gpt-4-1106-preview, which is the latest GPT-4 model with 128k context window and lower pricing
             "temperature": 0.2,  # higher temp more creative response lower temp more determinsitc
             "max_tokens": 3000,  # Increased to maximum recommended
+            "prompt_token_budget": int(
+                os.getenv("OPENAI_PROMPT_TOKEN_BUDGET", 60000)
+            ),  # Input tokens for template + tweets, busy days get trimmed to fit
+            # "single" one call per day, "map_reduce" summarise list chunks in parallel then merge
+            "mode": os.getenv("OPENAI_SUMMARY_MODE", "single"),
+            "map_chunk_size": 200,  # Tweets per map call
+            "map_max_tokens": 800,  # Output tokens per partial summary
+            "map_concurrency": 4,
             "messages_roles": "system",
         }
     }
@@ -102,6 +203,38 @@ class Config:
             Speculation - short interest, analyst calls
         Tweets to analyze:
         {tweets}
-        """
+        """,
+        "LIST_SUMMARY_PROMPT": """You are a professional investor speculator. Summarize these tweets from the {list_name} list.
+        Keep only what is relevant to the list: key insights with who said them, new projects and narratives,
+        important future events and deadlines, mentioned tickers. Be concise, use short bullet points.
+        Tweets to analyze:
+        {tweets}
+        """,
+        "INCREMENTAL_SUMMARY_PROMPT": """You are a professional investor speculator. Below is the summary of today's tweets so far,
+        followed by tweets posted since it was written. Update the summary with the new tweets: add new insights,
+        projects, events and tickers in the right list category, correct anything the new tweets contradict,
+        and keep the same format and sections. Return the full updated summary.
+        Current summary:
+        {summary}
+        New tweets:
+        {tweets}
+        """,
+        "MERGE_SUMMARY_PROMPT": """You are a professional investor speculator. Merge these partial summaries of today's tweets
+        into one comprehensive summary organized by list categories, removing duplicates.
+        For Crypto Traders:
+            Insights - Key insights and important information, @userA is bullish on BTC
+            New projects - emerging trend, new projects investments, Fundamental project/protocol updates changes
+            Events - Important future events, token unlocks, macro events :FED meetings, option expirations, earnings, CPI prints
+        Airdrops:
+           Deadlines -  Crypto/NFT Airdrop deadline claims, deadlines for tasks/snapshots
+           Tasks - reminder of airdrop tasks
+           New airdrops - new airdrops to follow
+        Stocks:
+            Mentioned stocks - stocks on the timeline, name ticker and reason of mention
+            Earnings - earnings announcements
+            Speculation - short interest, analyst calls
+        Partial summaries:
+        {summaries}
+        """,
     }
     # Critical events
@@ -0,0 +1,35 @@
+import re
+from typing import Iterable, List, Optional
+
+# Compiled once at import instead of on every call
+LINK_PATTERN = re.compile(r"http\S+")
+SYMBOL_PATTERN = re.compile(r"[^\w\s]")  # Punctuation and emojis
+# Unlock events: "CRYPTO: ENA Unlock" / "...: 94.19M ENA (~$35.16M, 1.78% of M.Cap)"
+UNLOCK_TITLE_PATTERN = re.compile(r"^CRYPTO:\s*(\S+)\s+Unlock")
+USD_AMOUNT_PATTERN = re.compile(r"\$\s*(\d[\d,]*(?:\.\d+)?)\s*([KMB])?")
+USD_MULTIPLIERS = {"K": 1e3, "M": 1e6, "B": 1e9}
+
+
+def clean_tweet_text(text: str) -> str:
+    """Clean tweet text for the prompt: links to a marker, no emojis or punctuation"""
+    return " ".join(SYMBOL_PATTERN.sub("", LINK_PATTERN.sub("link", text or "")).split())
+
+
+def clean_tweet_texts(texts: Iterable[str]) -> List[str]:
+    """Clean a batch of tweets, e.g. a page of tweets before it is saved"""
+    return [clean_tweet_text(text) for text in texts]
+
+
+def parse_unlock_symbol(title: str) -> Optional[str]:
+    """Token of an unlock event from its title, e.g. "ENA" """
+    match = UNLOCK_TITLE_PATTERN.match(title or "")
+    return match.group(1).upper() if match else None
+
+
+def parse_usd_amount(description: str) -> Optional[float]:
+    """First dollar amount in a description, e.g. 35160000.0 for "~$35.16M" """
+    match = USD_AMOUNT_PATTERN.search(description or "")
+    if not match:
+        return None
+    amount, suffix = match.groups()
+    return float(amount.replace(",", "")) * USD_MULTIPLIERS.get(suffix, 1)
@@ -0,0 +1,125 @@
+"""
+Load test for the dashboard API: p50/p99 latency and throughput.
+
+Sends requests to the read endpoints the frontend uses from a number of
+concurrent clients for a fixed duration. To compare two versions of the
+API (e.g. sync and async routes), save the results of the first run and
+pass them with --compare on the second.
+
+Usage: python -m benchmarks.api_load [--base-url http://localhost:8000]
+    [--concurrency 50] [--seconds 30] [--output after.json] [--compare before.json]
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from datetime import datetime, timedelta
+
+import aiohttp
+
+
+def default_paths() -> list:
+    yesterday = (datetime.utcnow() - timedelta(days=1)).strftime("%Y-%m-%d")
+    return [
+        "/api/events/",
+        "/api/summaries/",
+        f"/api/tweets/{yesterday}",
+        "/api/tweets/counts/",
+    ]
+
+
+def percentile(values: list, pct: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    index = min(len(values) - 1, round(pct / 100 * (len(values) - 1)))
+    return values[index]
+
+
+async def _client(session, base_url: str, paths: list, deadline: float, latencies: dict, errors: dict):
+    i = 0
+    while time.perf_counter() < deadline:
+        path = paths[i % len(paths)]
+        i += 1
+        started = time.perf_counter()
+        try:
+            async with session.get(base_url + path) as response:
+                await response.read()
+                if response.status >= 400:
+                    errors[path] = errors.get(path, 0) + 1
+                    continue
+        except aiohttp.ClientError:
+            errors[path] = errors.get(path, 0) + 1
+            continue
+        latencies.setdefault(path, []).append((time.perf_counter() - started) * 1000)
+
+
+async def run_load(base_url: str, concurrency: int, seconds: float, paths: list) -> dict:
+    latencies, errors = {}, {}
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        started = time.perf_counter()
+        deadline = started + seconds
+        await asyncio.gather(
+            *(
+                _client(session, base_url, paths[i:] + paths[:i], deadline, latencies, errors)
+                for i in range(concurrency)
+            )
+        )
+        elapsed = time.perf_counter() - started
+
+    def summarise(values):
+        return {
+            "requests": len(values),
+            "p50_ms": round(percentile(values, 50), 2),
+            "p99_ms": round(percentile(values, 99), 2),
+            "mean_ms": round(statistics.fmean(values), 2) if values else 0.0,
+        }
+
+    all_latencies = [value for values in latencies.values() for value in values]
+    return {
+        "base_url": base_url,
+        "concurrency": concurrency,
+        "seconds": round(elapsed, 2),
+        "requests_per_second": round(len(all_latencies) / elapsed, 1),
+        "errors": sum(errors.values()),
+        "overall": summarise(all_latencies),
+        "paths": {path: summarise(values) for path, values in latencies.items()},
+    }
+
+
+def compare(before: dict, after: dict) -> dict:
+    """Ratios of after to before; below 1 is better for latency"""
+
+    def ratio(a, b):
+        return round(a / b, 2) if b else None
+
+    return {
+        "requests_per_second": ratio(after["requests_per_second"], before["requests_per_second"]),
+        "p50_ms": ratio(after["overall"]["p50_ms"], before["overall"]["p50_ms"]),
+        "p99_ms": ratio(after["overall"]["p99_ms"], before["overall"]["p99_ms"]),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--seconds", type=float, default=30)
+    parser.add_argument("--path", action="append", help="Endpoint to load (repeatable)")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    parser.add_argument("--compare", help="Results JSON of a previous run to compare with")
+    args = parser.parse_args()
+
+    results = asyncio.run(
+        run_load(args.base_url, args.concurrency, args.seconds, args.path or default_paths())
+    )
+    if args.compare:
+        with open(args.compare) as f:
+            results["compared_to_previous"] = compare(json.load(f), results)
+    print(json.dumps(results, indent=2))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
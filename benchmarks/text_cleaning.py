@@ -0,0 +1,69 @@
+"""
+Micro-benchmark of tweet text cleaning: per-tweet uncompiled regexes
+(the old OpenAIService._clean_tweet_text) against the precompiled
+patterns in app.utils.text, and against reading the clean_text column
+stored at ingest.
+
+Usage: python -m benchmarks.text_cleaning [--tweets 100000]
+"""
+
+import argparse
+import json
+import random
+import re
+import time
+from pathlib import Path
+
+from app.utils.text import clean_tweet_texts
+
+SAMPLE_FILE = Path(__file__).parent.parent / "sample_tweets.json"
+
+
+def legacy_clean_tweet_text(text: str) -> str:
+    """OpenAIService._clean_tweet_text before precompiled patterns"""
+    text = re.sub(r"http\S+", "[link]", text)
+    text = " ".join(text.split())
+    text = re.sub(r"[^\w\s]", "", text)
+    text = re.sub(r"^RT @\w+:", "", text).strip()
+    return text
+
+
+def load_texts(count: int) -> list:
+    with open(SAMPLE_FILE, encoding="utf-8") as f:
+        samples = [tweet["text"] for tweet in json.load(f)]
+    random.seed(42)
+    return [random.choice(samples) for _ in range(count)]
+
+
+def timed(func, *args):
+    started = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - started
+
+
+def run_benchmark(count: int) -> dict:
+    texts = load_texts(count)
+
+    legacy, legacy_seconds = timed(lambda: [legacy_clean_tweet_text(t) for t in texts])
+    compiled, compiled_seconds = timed(clean_tweet_texts, texts)
+    # Prompt building with clean_text stored at ingest only skips empty rows
+    _, stored_seconds = timed(lambda: [t for t in compiled if t])
+
+    # The legacy path could leave double spaces where punctuation was removed
+    normalised_legacy = [" ".join(text.split()) for text in legacy]
+    assert compiled == normalised_legacy, "Cleaning output differs"
+
+    return {
+        "tweets": count,
+        "legacy_seconds": round(legacy_seconds, 3),
+        "compiled_seconds": round(compiled_seconds, 3),
+        "stored_seconds": round(stored_seconds, 3),
+        "compiled_speedup": round(legacy_seconds / compiled_seconds, 2),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--tweets", type=int, default=100000)
+    args = parser.parse_args()
+    print(json.dumps(run_benchmark(args.tweets), indent=2))
@@ -0,0 +1,100 @@
+"""
+Timings for TokenUnlocksService against a local aiohttp stub of the
+Mobula metadata endpoint, so no API key or network access is needed.
+
+The stub answers after a random latency and supports ETag revalidation.
+Three refreshes are timed: cold (empty cache), warm (within the TTL) and
+expired (TTL elapsed, answered with 304s).
+
+Usage: python -m benchmarks.token_unlocks [--latency 0.5] [--output results.json]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from datetime import datetime, timedelta
+
+from aiohttp import web
+
+from app.cache import Cache, MemoryBackend
+from app.services.token_unlocks import TOKENS, TokenUnlocksService
+from app.utils.config import Config
+
+
+def make_stub_app(latency: float) -> web.Application:
+    unlock_date = datetime.now() + timedelta(days=30)
+    stats = {"requests": 0, "not_modified": 0}
+
+    async def metadata(request):
+        stats["requests"] += 1
+        await asyncio.sleep(random.uniform(latency / 2, latency))
+        asset = request.query["asset"]
+        etag = f'"{asset}-v1"'
+        if request.headers.get("If-None-Match") == etag:
+            stats["not_modified"] += 1
+            return web.Response(status=304, headers={"ETag": etag})
+        body = {
+            "data": {
+                "release_schedule": [
+                    {
+                        "unlock_date": unlock_date.timestamp() * 1000,
+                        "tokens_to_unlock": 1000000,
+                        "allocation_details": {"Investors": 1000000},
+                    }
+                ]
+            }
+        }
+        return web.json_response(body, headers={"ETag": etag})
+
+    app = web.Application()
+    app["stats"] = stats
+    app.router.add_get("/metadata", metadata)
+    return app
+
+
+async def run_benchmark(latency: float) -> dict:
+    app = make_stub_app(latency)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    results = {"tokens": len(TOKENS), "max_latency_seconds": latency}
+    try:
+        service = TokenUnlocksService(
+            base_url=f"http://127.0.0.1:{port}",
+            api_key="stub",
+            cache=Cache(MemoryBackend(), "token_unlocks_benchmark"),
+        )
+        for run in ("cold", "warm", "expired"):
+            if run == "expired":
+                service.ttl_seconds = 0
+            before = dict(app["stats"])
+            started = time.perf_counter()
+            events = await service.get_token_unlocks()
+            results[run] = {
+                "seconds": round(time.perf_counter() - started, 3),
+                "events": len(events),
+                "requests": app["stats"]["requests"] - before["requests"],
+                "not_modified": app["stats"]["not_modified"] - before["not_modified"],
+            }
+    finally:
+        await runner.cleanup()
+    results["concurrency"] = Config.TOKEN_UNLOCKS_CONCURRENCY
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--latency", type=float, default=0.5)
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    results = asyncio.run(run_benchmark(args.latency))
+    print(json.dumps(results, indent=2))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
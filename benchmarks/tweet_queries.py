@@ -0,0 +1,159 @@
+"""
+EXPLAIN ANALYZE timings for the tweet repository queries.
+
+Seeds N synthetic tweets inside a transaction, runs each repository
+function, captures the SQL it emits and records EXPLAIN ANALYZE for it.
+The transaction is rolled back at the end, so the database is unchanged.
+
+Usage: python -m benchmarks.tweet_queries --rows 100000 [--output results.json]
+"""
+
+import argparse
+import json
+import logging
+from datetime import datetime, timedelta
+
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+from app.database.session import engine
+from app.repositories import tweet_repository
+from app.repositories.tweet_day_stats_repository import ROLLUP_UPSERT_SQL
+from app.services.tweet_partitions import ensure_tweet_partitions
+from app.utils import setup_logger
+from app.utils.config import Config
+
+logger = logging.getLogger(__name__)
+
+# Seeds the tweet_day_stats rollup alongside, as ingestion does
+SEED_SQL = text(
+    f"""
+    WITH seeded AS (
+        INSERT INTO tweets (tweet_id, text, created_at, author_id, list_id, author_username, author_name)
+        SELECT
+            :base_id + g,
+            'synthetic tweet ' || g,
+            :newest - (g % (:days * 1440)) * interval '1 minute',
+            g % 500,
+            (:list_ids)[1 + g % cardinality(:list_ids)],
+            'user' || (g % 500),
+            'User ' || (g % 500)
+        FROM generate_series(1, :rows) AS g
+        ON CONFLICT (tweet_id, created_at) DO NOTHING
+        RETURNING tweet_id, created_at, list_id
+    ), rollup AS (
+        {ROLLUP_UPSERT_SQL.format(source="seeded")}
+    )
+    SELECT count(*) FROM seeded
+    """
+)
+
+
+def _plan_nodes(plan: dict) -> list:
+    """Flatten plan node types, e.g. ["Limit", "Index Scan"]"""
+    nodes = [plan["Node Type"]]
+    for child in plan.get("Plans", []):
+        nodes.extend(_plan_nodes(child))
+    return nodes
+
+
+def explain_repository_call(connection, db, func, *args) -> dict:
+    """Run a repository function and EXPLAIN ANALYZE every statement it issues"""
+    captured = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        captured.append((statement, parameters))
+
+    event.listen(connection, "before_cursor_execute", capture)
+    try:
+        func(db, *args)
+    finally:
+        event.remove(connection, "before_cursor_execute", capture)
+
+    results = []
+    for statement, parameters in captured:
+        explained = connection.exec_driver_sql(
+            f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {statement}", parameters
+        ).scalar()
+        plan = explained[0]
+        results.append(
+            {
+                "planning_ms": plan["Planning Time"],
+                "execution_ms": plan["Execution Time"],
+                "nodes": _plan_nodes(plan["Plan"]),
+            }
+        )
+    return {
+        "planning_ms": round(sum(r["planning_ms"] for r in results), 3),
+        "execution_ms": round(sum(r["execution_ms"] for r in results), 3),
+        "nodes": [n for r in results for n in r["nodes"]],
+    }
+
+
+def run_benchmark(rows: int, days: int = 30) -> dict:
+    list_ids = list(Config.TWITTER_LISTS)
+    newest = datetime.utcnow().replace(microsecond=0)
+    day = datetime.combine((newest - timedelta(days=1)).date(), datetime.min.time())
+
+    cases = {
+        "get_tweets": (tweet_repository.get_tweets, 500),
+        "get_latest_tweet_id_by_list": (
+            tweet_repository.get_latest_tweet_id_by_list,
+            list_ids[0],
+        ),
+        "get_recent_tweets": (tweet_repository.get_recent_tweets, list_ids[0], 20),
+        # Same query as /api/tweets/{date}
+        "get_tweets_by_date_range": (
+            tweet_repository.get_tweets_by_date_range,
+            day,
+            day + timedelta(days=1),
+        ),
+        "get_dates_without_summaries": (tweet_repository.get_dates_without_summaries,),
+    }
+
+    results = {}
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        try:
+            db = Session(bind=connection)
+            ensure_tweet_partitions(db, start=newest - timedelta(days=days))
+
+            logger.info(f"Seeding {rows} synthetic tweets...")
+            connection.execute(
+                SEED_SQL,
+                {
+                    "base_id": 9 * 10**18,
+                    "newest": newest,
+                    "days": days,
+                    "list_ids": list_ids,
+                    "rows": rows,
+                },
+            )
+            connection.exec_driver_sql("ANALYZE tweets, tweet_day_stats")
+
+            for name, (func, *args) in cases.items():
+                results[name] = explain_repository_call(connection, db, func, *args)
+                logger.info(
+                    f"{name}: {results[name]['execution_ms']}ms "
+                    f"(planning {results[name]['planning_ms']}ms) "
+                    f"{' > '.join(results[name]['nodes'])}"
+                )
+            db.close()
+        finally:
+            transaction.rollback()
+
+    return {"rows": rows, "ran_at": newest.isoformat(), "queries": results}
+
+
+if __name__ == "__main__":
+    setup_logger()
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    benchmark = run_benchmark(args.rows, args.days)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(benchmark, f, indent=2)